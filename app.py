@@ -18,10 +18,11 @@ import os
 import hmac
 import logging
 from dotenv import load_dotenv
-from flask import Flask, request, Response
+from flask import Flask, g, request, Response
 
-from config import ApiConfig
+from config import get_api_config
 from src.core.logging import setup_logging
+from src.utils.jsonio import loads as json_loads
 from src.routes import ollama_bp, openai_bp, anthropic_bp
 from src.routes.quota import quota_bp
 from src.routes.keys import keys_bp
@@ -79,8 +80,27 @@ def create_app() -> Flask:
                 mimetype='application/json'
             )
     
-    # API 설정 초기화 및 앱 컨텍스트에 저장
-    app.config['api_config'] = ApiConfig()
+    @app.before_request
+    def parse_json_body():
+        """POST 본문을 jsonio(orjson 폴백 포함)로 한 번만 파싱해 g에 둡니다.
+
+        라우트의 request.get_json(force=True)는 stdlib json을 쓰므로,
+        긴 messages 배열이 있는 채팅 요청에서 파싱 비용이 큽니다.
+        이 앱의 POST 엔드포인트는 모두 JSON 본문을 기대합니다.
+        """
+        if request.method != 'POST':
+            return None
+        try:
+            g.json_body = json_loads(request.get_data(cache=True))
+        except ValueError:
+            return Response(
+                '{"error":{"message":"invalid JSON body","type":"invalid_request_error"}}',
+                status=400,
+                mimetype='application/json'
+            )
+
+    # API 설정 초기화 및 앱 컨텍스트에 저장 (프로세스 전역 싱글톤 재사용)
+    app.config['api_config'] = get_api_config()
     
     # Blueprint 등록
     app.register_blueprint(ollama_bp)
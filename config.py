@@ -5,6 +5,8 @@ API 설정 모듈
 각 LLM 제공업체의 API 키 순환기와 OAuth 관리자를 초기화합니다.
 """
 
+from functools import lru_cache
+
 from src.auth.key_rotator import KeyRotator
 from src.auth.qwen_oauth import QwenOAuthManager
 
@@ -81,3 +83,14 @@ class ApiConfig:
         # OpenCode Go (OpenAI 호환)
         self.opencode_rotator = KeyRotator("OpenCode", "OPENCODE_API_KEYS")
         self.opencode_rotator.log_key_count()
+
+
+@lru_cache(maxsize=1)
+def get_api_config() -> ApiConfig:
+    """
+    프로세스 전역 ApiConfig 싱글톤을 반환합니다.
+
+    환경 변수 파싱과 키 목록 구성은 비용이 있으므로 한 번만 수행하고,
+    create_app이 여러 번 호출되어도 같은 인스턴스를 재사용합니다.
+    """
+    return ApiConfig()
@@ -3,23 +3,60 @@
 API 키 순환 관리 모듈
 
 멀티 프로세스 환경에서 안전하게 API 키를 순환하며 사용할 수 있도록 합니다.
-파일 기반 락을 사용하여 프로세스 간 동기화를 보장합니다.
+공유 메모리 카운터(multiprocessing.Value)로 프로세스 간 동기화를 보장합니다.
+(gunicorn --preload 로 fork 되기 전에 생성되어 워커 전체가 공유합니다.)
 쿼터 기반 선택 및 Rate Limit 핸들링을 지원합니다.
 """
 
 import os
+import ctypes
+import hashlib
 import logging
-import fcntl
+import multiprocessing
+import random
 import time
+from functools import lru_cache
 from threading import Lock
 from typing import Dict, Optional, List
 from dataclasses import dataclass, field
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _load_keys_from_env(env_var_name: str) -> tuple:
+    """
+    환경 변수에서 API 키 목록을 파싱합니다.
+
+    지원 포맷:
+    - 콤마(,) 구분: KEY1,KEY2,KEY3
+    - 개행 구분(멀티라인):
+      KEY1\nKEY2\nKEY3
+
+    위 2가 혼합되어 있어도 모두 처리합니다.
+
+    파싱 결과는 프로세스 수명 동안 변하지 않으므로 환경 변수당 한 번만
+    수행하고 불변 tuple로 캐시합니다.
+    """
+    keys_str = os.getenv(env_var_name, "")
+    if not keys_str:
+        logger.warning(
+            f"[KeyRotator] {env_var_name} 환경 변수가 설정되지 않았습니다."
+        )
+        return ()
+
+    normalized = keys_str.replace(",", "\n")
+    return tuple(key.strip() for key in normalized.splitlines() if key.strip())
+
+
+@dataclass(slots=True)
 class KeyHealth:
-    """개별 키의 상태 정보"""
+    """개별 키의 상태 정보 (요청마다 접근하므로 __slots__로 조회/메모리 절감)"""
+
+    # 서킷 브레이커: 연속 실패가 임계값에 도달하면 일정 시간 키를 건너뜁니다.
+    CIRCUIT_FAILURE_THRESHOLD = 3
+    CIRCUIT_OPEN_SECONDS = 60
 
     key_hash: str  # 키 식별용 해시
     usage_count: int = 0  # 사용 횟수
@@ -28,6 +65,8 @@ class KeyHealth:
     last_failure: Optional[float] = None  # 마지막 실패 시각
     is_rate_limited: bool = False  # Rate Limit 상태
     rate_limit_until: Optional[float] = None  # Rate Limit 복귀 예정 시각
+    consecutive_failures: int = 0  # 연속 실패 횟수 (성공 시 초기화)
+    circuit_open_until: Optional[float] = None  # 서킷 오픈 해제 예정 시각
 
     @property
     def health_score(self) -> float:
@@ -59,6 +98,11 @@ class KeyHealth:
             # Rate Limit 복귀 시간 지났으면 상태 초기화
             self.is_rate_limited = False
             self.rate_limit_until = None
+        if self.circuit_open_until is not None:
+            if time.time() < self.circuit_open_until:
+                return False
+            # 오픈 시간이 지나면 half-open: 한 번 더 시도하게 허용
+            self.circuit_open_until = None
         return True
 
     def mark_used(self) -> None:
@@ -72,6 +116,10 @@ class KeyHealth:
         """실패 표시"""
         self.failure_count += 1
         self.last_failure = time.time()
+        self.consecutive_failures += 1
+
+        if self.consecutive_failures >= self.CIRCUIT_FAILURE_THRESHOLD:
+            self.circuit_open_until = time.time() + self.CIRCUIT_OPEN_SECONDS
 
         if is_rate_limit:
             self.is_rate_limited = True
@@ -80,33 +128,19 @@ class KeyHealth:
             else:
                 self.rate_limit_until = time.time() + 60  # 기본 60초
 
+    def mark_success(self) -> None:
+        """성공 표시 - 연속 실패 카운터와 서킷을 초기화합니다."""
+        self.consecutive_failures = 0
+        self.circuit_open_until = None
+
     def reset(self) -> None:
         """상태 초기화"""
         self.failure_count = 0
         self.is_rate_limited = False
         self.rate_limit_until = None
         self.last_failure = None
-
-
-class FileLock:
-    """
-    파일 기반 락 컨텍스트 매니저
-
-    멀티 프로세스 환경에서 임계 영역을 보호하기 위해 사용합니다.
-    """
-
-    def __init__(self, filename: str):
-        self.filename = filename
-        self.file = None
-
-    def __enter__(self):
-        self.file = open(self.filename, "w")
-        fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
-        self.file.close()
+        self.consecutive_failures = 0
+        self.circuit_open_until = None
 
 
 class KeyRotator:
@@ -140,6 +174,20 @@ class KeyRotator:
         self.api_keys = self._load_api_keys(env_var_name)
         self._lock = Lock()  # 스레드 간 동기화용
 
+        # 프로세스 간 공유 순환 인덱스.
+        # 파일 락 + /tmp 인덱스 파일 대신 공유 메모리 카운터를 사용해
+        # 요청마다 발생하던 open/flock/read/write 시스템 콜을 제거합니다.
+        self._shared_index = multiprocessing.Value(ctypes.c_int64, -1)
+
+        # 키 → (인덱스, 해시) 매핑. 요청마다 키 목록을 선형 탐색하지 않도록
+        # 초기화 시점에 한 번만 계산합니다.
+        self._key_index_map: Dict[str, int] = {
+            key: i for i, key in enumerate(self.api_keys)
+        }
+        self._key_hash_map: Dict[str, str] = {
+            key: self._hash_key(key) for key in self.api_keys
+        }
+
         # 키별 상태 추적
         self.key_health: Dict[int, KeyHealth] = {}
         self._init_key_health()
@@ -152,37 +200,18 @@ class KeyRotator:
 
     def _hash_key(self, key: str) -> str:
         """키의 해시를 생성합니다."""
-        import hashlib
-
         return hashlib.sha256(key.encode()).hexdigest()[:8]
 
-    def _load_api_keys(self, env_var_name: str) -> list:
-        """
-        환경 변수에서 API 키 목록을 로드합니다.
-
-        지원 포맷:
-        - 콤마(,) 구분: KEY1,KEY2,KEY3
-        - 개행 구분(멀티라인):
-          KEY1\nKEY2\nKEY3
-
-        위 2가 혼합되어 있어도 모두 처리합니다.
-        """
-        keys_str = os.getenv(env_var_name, "")
-        if not keys_str:
-            logging.warning(
-                f"[KeyRotator] {env_var_name} 환경 변수가 설정되지 않았습니다."
-            )
-            return []
-
-        normalized = keys_str.replace(",", "\n")
-        return [key.strip() for key in normalized.splitlines() if key.strip()]
+    def _load_api_keys(self, env_var_name: str) -> tuple:
+        """환경 변수에서 API 키 목록을 로드합니다 (모듈 레벨 캐시 사용)."""
+        return _load_keys_from_env(env_var_name)
 
     def get_next_key(self, quota_fraction: Optional[float] = None) -> str:
         """
         다음 API 키를 순환하며 반환합니다.
 
         쿼터 정보를 제공하면 쿼터-aware 선택을 수행합니다.
-        파일 기반 인덱스를 사용하여 멀티 프로세스 환경에서도
+        공유 메모리 인덱스를 사용하여 멀티 프로세스 환경에서도
         모든 키가 균등하게 사용되도록 합니다.
 
         Args:
@@ -194,40 +223,62 @@ class KeyRotator:
         if not self.api_keys:
             return ""
 
-        # 프로세스 간 공유를 위한 파일 경로
-        lock_file = f"/tmp/key_rotator_{self.provider}.lock"
-        index_file = f"/tmp/key_rotator_{self.provider}.index"
+        # 키가 하나뿐이면 순환할 것이 없으므로 공유 인덱스 동기화를 건너뜁니다.
+        # (단일 키 배포가 흔한 케이스)
+        if len(self.api_keys) == 1:
+            self.key_health[0].mark_used()
+            return self.api_keys[0]
+
+        # 핫 패스 락은 프로세스 간 인덱스를 지키는 공유 메모리 락 하나만
+        # 사용합니다. 예전에는 스레드 락(self._lock)을 바깥에 중첩해
+        # 요청마다 두 번의 acquire/release가 발생했는데, 아래 key_health
+        # 접근은 통계성 카운터라 GIL 하의 best-effort로 충분합니다.
+        # (itertools.count 방식의 완전 lock-free는 프로세스 간 균등 순환이
+        # 깨지므로 채택하지 않았습니다.)
+        with self._shared_index.get_lock():
+            current_index = int(self._shared_index.value)
+
+            # 쿼터-aware 선택 또는 Round-Robin
+            if quota_fraction is not None:
+                new_index = self._select_quota_aware_index(
+                    current_index, quota_fraction
+                )
+            else:
+                new_index = self._next_round_robin_index(current_index)
 
-        new_index = 0
+            # 새 인덱스 저장
+            self._shared_index.value = new_index
 
-        # 스레드 락 + 파일 락으로 이중 보호
-        with self._lock:
-            with FileLock(lock_file):
-                # 현재 인덱스 읽기
-                current_index = self._read_index(index_file)
-
-                # 쿼터-aware 선택 또는 Round-Robin
-                if quota_fraction is not None:
-                    new_index = self._select_quota_aware_index(
-                        current_index, quota_fraction
-                    )
-                else:
-                    new_index = (current_index + 1) % len(self.api_keys)
-
-                # 새 인덱스 저장
-                self._write_index(index_file, new_index)
-
-                # 키 사용 표시
-                if new_index in self.key_health:
-                    self.key_health[new_index].mark_used()
-                else:
-                    self.key_health[new_index] = KeyHealth(
-                        key_hash=self._hash_key(self.api_keys[new_index])
-                    )
-                    self.key_health[new_index].mark_used()
+        # 키 사용 표시 (락 밖: usage_count/last_used는 근사 통계)
+        health = self.key_health.get(new_index)
+        if health is None:
+            health = self.key_health.setdefault(
+                new_index,
+                KeyHealth(key_hash=self._hash_key(self.api_keys[new_index])),
+            )
+        health.mark_used()
+
+        return self.api_keys[new_index]
+
+    def _next_round_robin_index(self, current_index: int) -> int:
+        """
+        Round-Robin으로 다음 키 인덱스를 선택합니다.
 
-        key = self.api_keys[new_index]
-        return key
+        서킷이 열렸거나 Rate Limit 중인 키는 건너뜁니다.
+        모든 키가 사용 불가면 기존 동작(단순 순환)으로 폴백하여
+        요청이 키 없이 실패하지 않도록 합니다.
+        """
+        for offset in range(len(self.api_keys)):
+            candidate = (current_index + 1 + offset) % len(self.api_keys)
+            health = self.key_health.get(candidate)
+            if health is None or health.is_available:
+                return candidate
+
+        logger.warning(
+            "[KeyRotator] [%s] 사용 가능한 키가 없어 순환 순서 그대로 사용합니다.",
+            self.provider,
+        )
+        return (current_index + 1) % len(self.api_keys)
 
     def _select_quota_aware_index(
         self, current_index: int, quota_fraction: float
@@ -272,7 +323,7 @@ class KeyRotator:
             # 점수 가장 높은 키 선택
             candidates.sort(key=lambda x: x[1], reverse=True)
             selected = candidates[0][0]
-            logging.debug(
+            logger.debug(
                 f"[KeyRotator] [{self.provider}] 쿼터-aware 선택: "
                 f"index={selected}, tier={tier}, score={candidates[0][1]:.2f}"
             )
@@ -304,8 +355,6 @@ class KeyRotator:
 
         점수 = 건강도 + 최근 사용惩罚 + 랜덤 (경쟁 방지)
         """
-        import random
-
         # 건강도 점수
         health_score = health.health_score
 
@@ -323,6 +372,13 @@ class KeyRotator:
         score = health_score - recent_penalty + random_factor
         return max(0.0, score)
 
+    def get_key_context(self, key: str) -> Optional[tuple]:
+        """키의 (인덱스, 해시)를 반환합니다. 알 수 없는 키면 None."""
+        index = self._key_index_map.get(key)
+        if index is None:
+            return None
+        return index, self._key_hash_map[key]
+
     def mark_key_failure(
         self, key: str, is_rate_limit: bool = False, retry_after: Optional[int] = None
     ) -> None:
@@ -334,27 +390,51 @@ class KeyRotator:
             is_rate_limit: Rate Limit 여부
             retry_after: 재시도까지의 초
         """
+        context = self.get_key_context(key)
+        if context is None:
+            return
+        i, key_hash = context
+
+        with self._lock:
+            if i in self.key_health:
+                self.key_health[i].mark_failure(is_rate_limit, retry_after)
+
+            if is_rate_limit:
+                logger.warning(
+                    f"[KeyRotator] [{self.provider}] Rate Limit 감지 | "
+                    f"key_index={i} | key_hash={key_hash} | retry_after={retry_after}"
+                )
+            else:
+                logger.warning(
+                    f"[KeyRotator] [{self.provider}] 키 실패 기록 | "
+                    f"key_index={i} | key_hash={key_hash}"
+                )
+
+    def mark_key_success(self, key: str) -> None:
+        """
+        키의 성공을 기록합니다.
+
+        연속 실패 카운터를 초기화하여 서킷 브레이커가 다시 닫히도록 합니다.
+
+        Args:
+            key: 성공한 키
+        """
+        context = self.get_key_context(key)
+        if context is None:
+            return
+        i, _ = context
+
         with self._lock:
-            for i, k in enumerate(self.api_keys):
-                if k == key:
-                    if i in self.key_health:
-                        self.key_health[i].mark_failure(is_rate_limit, retry_after)
-
-                    if is_rate_limit:
-                        logging.warning(
-                            f"[KeyRotator] [{self.provider}] Rate Limit 감지 | "
-                            f"key_index={i} | key_hash={self._hash_key(k)} | retry_after={retry_after}"
-                        )
-                    else:
-                        logging.warning(
-                            f"[KeyRotator] [{self.provider}] 키 실패 기록 | "
-                            f"key_index={i} | key_hash={self._hash_key(k)}"
-                        )
-                    break
+            health = self.key_health.get(i)
+            if health is not None:
+                health.mark_success()
 
     def get_available_key_count(self) -> int:
         """사용 가능한 키 개수를 반환합니다."""
-        return sum(1 for h in self.key_health.values() if h.is_available)
+        # is_available은 Rate Limit 복귀 시 상태를 되돌리는 쓰기 동작이 있으므로
+        # 다른 스레드의 mark_key_failure/mark_key_success와 같은 락으로 보호합니다.
+        with self._lock:
+            return sum(1 for h in self.key_health.values() if h.is_available)
 
     def get_key_status(self) -> List[Dict]:
         """모든 키의 상태 정보를 반환합니다."""
@@ -385,28 +465,8 @@ class KeyRotator:
                     )
             return status
 
-    def _read_index(self, index_file: str) -> int:
-        """인덱스 파일에서 현재 인덱스를 읽습니다."""
-        if not os.path.exists(index_file):
-            return -1
-        try:
-            with open(index_file, "r") as f:
-                content = f.read().strip()
-                return int(content) if content else -1
-        except (ValueError, IOError) as e:
-            logging.error(f"[KeyRotator] 인덱스 파일 읽기 실패: {e}")
-            return -1
-
-    def _write_index(self, index_file: str, index: int) -> None:
-        """인덱스 파일에 새 인덱스를 저장합니다."""
-        try:
-            with open(index_file, "w") as f:
-                f.write(str(index))
-        except IOError as e:
-            logging.error(f"[KeyRotator] 인덱스 파일 쓰기 실패: {e}")
-
     def log_key_count(self) -> None:
         """로드된 API 키 개수를 로깅합니다."""
-        logging.info(
+        logger.info(
             f"[KeyRotator] [{self.provider}] API 키 수: {len(self.api_keys)}개"
         )
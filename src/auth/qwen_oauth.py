@@ -11,7 +11,13 @@ import os
 import logging
 import requests
 import time
-from threading import Lock
+from threading import Event, Lock, Thread
+from typing import Optional
+
+from src.core.http import http_session
+from src.utils.jsonio import loads as json_loads
+
+logger = logging.getLogger(__name__)
 
 
 class QwenOAuthManager:
@@ -28,57 +34,164 @@ class QwenOAuthManager:
     
     CREDENTIALS_PATH = os.path.expanduser("~/.qwen/oauth_creds.json")
     REFRESH_ENDPOINT = "https://portal.qwen.ai/api/v1/oauth/token"
-    
+
+    # 만료 60초 전에 백그라운드에서 미리 갱신합니다.
+    REFRESH_MARGIN_SECONDS = 60
+    # 만료 시간을 모를 때 재확인 주기 / 갱신 실패 시 재시도 간격
+    REFRESH_RECHECK_SECONDS = 300
+    REFRESH_RETRY_SECONDS = 30
+
     def __init__(self):
         self.provider = "Qwen"
         self._lock = Lock()
         self._access_token = None
         self._refresh_token = None
         self._expires_at = None
+        self._expires_mono = None
+        self._bearer_header = None
+        self._stop_event = Event()
+        self._refresh_thread = None
+        self._refresh_thread_pid = None
+        self._last_refresh_at = 0.0
         self._load_credentials()
     
     def _load_credentials(self) -> None:
         """oauth_creds.json 파일에서 토큰을 로드합니다."""
         try:
-            if os.path.exists(self.CREDENTIALS_PATH):
-                with open(self.CREDENTIALS_PATH, 'r') as f:
-                    creds = json.load(f)
-                    self._access_token = creds.get('access_token')
-                    self._refresh_token = creds.get('refresh_token')
-                    self._expires_at = creds.get('expires_at')
-                    logging.info(f"[QwenOAuth] 토큰 로드 완료: {self.CREDENTIALS_PATH}")
-            else:
-                logging.warning(f"[QwenOAuth] 토큰 파일 없음: {self.CREDENTIALS_PATH}")
-        except json.JSONDecodeError as e:
-            logging.error(f"[QwenOAuth] 토큰 파일 파싱 실패: {e}")
+            # 파일이 없으면 open이 바로 실패하므로 별도 exists 스탯을 생략하고,
+            # 파싱은 다른 핫 패스와 같은 jsonio(orjson 폴백 포함)로 처리합니다.
+            with open(self.CREDENTIALS_PATH, 'rb') as f:
+                creds = json_loads(f.read())
+            self._access_token = creds.get('access_token')
+            self._refresh_token = creds.get('refresh_token')
+            self._expires_at = creds.get('expires_at')
+            self._update_bearer_header()
+            self._update_expiry_deadline()
+            logger.info(f"[QwenOAuth] 토큰 로드 완료: {self.CREDENTIALS_PATH}")
+        except FileNotFoundError:
+            logger.warning(f"[QwenOAuth] 토큰 파일 없음: {self.CREDENTIALS_PATH}")
+        except ValueError as e:
+            logger.error(f"[QwenOAuth] 토큰 파일 파싱 실패: {e}")
         except IOError as e:
-            logging.error(f"[QwenOAuth] 토큰 파일 읽기 실패: {e}")
+            logger.error(f"[QwenOAuth] 토큰 파일 읽기 실패: {e}")
     
     def _save_credentials(self) -> None:
-        """갱신된 토큰을 파일에 저장합니다."""
+        """갱신된 토큰을 파일에 원자적으로 저장합니다.
+
+        메모리에서 직렬화한 뒤 임시 파일에 한 번의 write로 쓰고
+        os.replace로 교체합니다. 쓰는 도중 프로세스가 죽어도
+        기존 파일이 잘린 상태로 남지 않고, 시크릿 파일이므로
+        0600 권한으로 생성합니다.
+        """
         try:
             creds = {
                 'access_token': self._access_token,
                 'refresh_token': self._refresh_token,
                 'expires_at': self._expires_at
             }
+            data = json.dumps(creds, indent=2).encode('utf-8')
             # 디렉토리가 없으면 생성
             os.makedirs(os.path.dirname(self.CREDENTIALS_PATH), exist_ok=True)
-            with open(self.CREDENTIALS_PATH, 'w') as f:
-                json.dump(creds, f, indent=2)
-            logging.info("[QwenOAuth] 토큰 저장 완료")
-        except IOError as e:
-            logging.error(f"[QwenOAuth] 토큰 저장 실패: {e}")
+            tmp_path = self.CREDENTIALS_PATH + '.tmp'
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.CREDENTIALS_PATH)
+            logger.info("[QwenOAuth] 토큰 저장 완료")
+        except OSError as e:
+            logger.error(f"[QwenOAuth] 토큰 저장 실패: {e}")
     
     def get_access_token(self) -> str:
         """
         현재 access_token을 반환합니다.
-        
+
+        평소에는 백그라운드 스레드가 만료 전에 미리 갱신하므로
+        요청 경로에서 갱신 HTTP 왕복을 기다리지 않습니다.
+        백그라운드 갱신이 실패한 경우에만 온디맨드로 갱신합니다.
+
         Returns:
             access_token 문자열, 없으면 None
         """
+        self._ensure_refresh_thread()
+        if not self.is_token_valid() and self._refresh_token:
+            self.refresh_access_token()
+        # 읽기 경로는 락 없이 반환합니다. _access_token은 단일 참조 교체라
+        # GIL 하에서 원자적이고, 갱신(쓰기)만 _lock으로 직렬화됩니다.
+        return self._access_token
+
+    def get_bearer_header(self) -> Optional[str]:
+        """미리 결합해 둔 'Bearer <token>' 헤더 값을 반환합니다.
+
+        토큰이 바뀔 때만 문자열을 만들고, 요청마다 결합을 반복하지
+        않습니다. 토큰이 없으면 None입니다.
+        """
+        return self._bearer_header
+
+    def _update_bearer_header(self) -> None:
+        """현재 access_token에 맞춰 Bearer 헤더 캐시를 갱신합니다."""
+        if self._access_token:
+            self._bearer_header = "Bearer " + self._access_token
+        else:
+            self._bearer_header = None
+
+    def _update_expiry_deadline(self) -> None:
+        """만료 시각을 monotonic 기준 데드라인으로 변환해 캐시합니다.
+
+        유효성 검사가 wall clock 점프(NTP 보정 등)에 흔들리지 않고,
+        핫 패스에서 더 싼 time.monotonic() 비교만 수행하게 합니다.
+        """
+        if self._expires_at:
+            self._expires_mono = time.monotonic() + (self._expires_at - time.time())
+        else:
+            self._expires_mono = None
+
+    def _ensure_refresh_thread(self) -> None:
+        """백그라운드 갱신 스레드를 (필요 시) 시작합니다.
+
+        gunicorn --preload에서는 마스터에서 만든 스레드가 fork 후
+        사라지므로, 워커 프로세스의 첫 사용 시점에 pid를 확인하여
+        지연 시작합니다.
+        """
+        if not self._refresh_token:
+            return
+        pid = os.getpid()
+        if self._refresh_thread is not None and self._refresh_thread_pid == pid:
+            return
         with self._lock:
-            return self._access_token
+            if self._refresh_thread is not None and self._refresh_thread_pid == pid:
+                return
+            self._refresh_thread = Thread(
+                target=self._refresh_loop,
+                name="qwen-oauth-refresh",
+                daemon=True,
+            )
+            self._refresh_thread_pid = pid
+            self._refresh_thread.start()
+
+    def _seconds_until_refresh(self) -> float:
+        """다음 선제 갱신까지 대기할 시간(초)을 계산합니다."""
+        if not self._expires_at:
+            return float(self.REFRESH_RECHECK_SECONDS)
+        return max(
+            1.0, self._expires_at - time.time() - self.REFRESH_MARGIN_SECONDS
+        )
+
+    def _refresh_loop(self) -> None:
+        """만료 전 여유 시간에 토큰을 선제적으로 갱신하는 루프입니다."""
+        while not self._stop_event.wait(self._seconds_until_refresh()):
+            # 대기 중 다른 경로(온디맨드 갱신 등)로 이미 연장됐으면 스킵
+            if self._expires_at and time.time() < (
+                self._expires_at - self.REFRESH_MARGIN_SECONDS
+            ):
+                continue
+            if not self.refresh_access_token():
+                self._stop_event.wait(self.REFRESH_RETRY_SECONDS)
+
+    def stop_refresh_thread(self) -> None:
+        """백그라운드 갱신 스레드를 종료합니다 (테스트/정리용)."""
+        self._stop_event.set()
     
     def refresh_access_token(self) -> bool:
         """
@@ -89,13 +202,18 @@ class QwenOAuthManager:
         """
         with self._lock:
             if not self._refresh_token:
-                logging.error("[QwenOAuth] refresh_token 없음 - 갱신 불가")
+                logger.error("[QwenOAuth] refresh_token 없음 - 갱신 불가")
                 return False
-            
+
+            # 갱신 폭주 방지: 락 대기 중 다른 스레드가 방금 갱신했다면
+            # 같은 refresh_token으로 다시 호출하지 않고 그 결과를 씁니다.
+            if time.time() - self._last_refresh_at < 5:
+                return True
+
             try:
-                logging.info("[QwenOAuth] access_token 갱신 시도...")
+                logger.info("[QwenOAuth] access_token 갱신 시도...")
                 
-                response = requests.post(
+                response = http_session.post(
                     self.REFRESH_ENDPOINT,
                     json={
                         'grant_type': 'refresh_token',
@@ -119,21 +237,24 @@ class QwenOAuthManager:
                     elif data.get('expires_in'):
                         self._expires_at = int(time.time()) + data.get('expires_in')
                     
+                    self._update_bearer_header()
+                    self._update_expiry_deadline()
                     self._save_credentials()
-                    logging.info("[QwenOAuth] access_token 갱신 성공")
+                    self._last_refresh_at = time.time()
+                    logger.info("[QwenOAuth] access_token 갱신 성공")
                     return True
                 else:
-                    logging.error(
+                    logger.error(
                         f"[QwenOAuth] 토큰 갱신 실패 - "
                         f"상태: {response.status_code}, 응답: {response.text}"
                     )
                     return False
                     
             except requests.RequestException as e:
-                logging.error(f"[QwenOAuth] 토큰 갱신 중 네트워크 오류: {e}")
+                logger.error(f"[QwenOAuth] 토큰 갱신 중 네트워크 오류: {e}")
                 return False
             except Exception as e:
-                logging.error(f"[QwenOAuth] 토큰 갱신 중 예외: {e}")
+                logger.error(f"[QwenOAuth] 토큰 갱신 중 예외: {e}")
                 return False
     
     def is_token_valid(self) -> bool:
@@ -147,13 +268,14 @@ class QwenOAuthManager:
         """
         if not self._access_token:
             return False
-        if not self._expires_at:
+        if self._expires_mono is None:
             return True  # 만료 시간이 없으면 유효하다고 가정
-        return time.time() < (self._expires_at - 30)
+        # monotonic 데드라인 비교: wall clock 점프에 영향받지 않습니다
+        return time.monotonic() < (self._expires_mono - 30)
     
     def log_key_count(self) -> None:
         """KeyRotator와의 호환성을 위한 로깅 메서드입니다."""
         if self._access_token:
-            logging.info("[QwenOAuth] OAuth 토큰 로드됨")
+            logger.info("[QwenOAuth] OAuth 토큰 로드됨")
         else:
-            logging.warning(f"[QwenOAuth] OAuth 토큰 없음 - 파일 확인 필요: {self.CREDENTIALS_PATH}")
+            logger.warning(f"[QwenOAuth] OAuth 토큰 없음 - 파일 확인 필요: {self.CREDENTIALS_PATH}")
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+공용 HTTP 세션 모듈
+
+프로세스 전역 requests.Session을 제공합니다.
+제공업체 API 호출과 OAuth 토큰 갱신이 같은 커넥션 풀을 공유하여
+호출마다 TCP+TLS 핸드셰이크를 반복하지 않습니다.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def _build_http_session() -> requests.Session:
+    """커넥션 풀이 설정된 공용 requests.Session을 생성합니다."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 프로세스 전역 커넥션 풀.
+# 클라이언트가 요청마다 새로 생성되더라도 업스트림 연결을 재사용합니다.
+http_session = _build_http_session()
@@ -5,37 +5,166 @@
 애플리케이션 전체에서 일관된 로깅 형식과 설정을 제공합니다.
 """
 
+import atexit
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+# 백그라운드 로그 리스너 (setup_logging에서 시작, 프로세스 종료 시 정리)
+_log_listener = None
+
+# 리스너 스레드가 살아 있는 프로세스의 pid.
+# gunicorn --preload에서는 setup_logging()이 마스터에서 실행되어
+# fork된 워커에는 리스너 스레드가 없으므로, 워커의 첫 로그에서
+# pid 불일치를 감지해 되살립니다. (QwenOAuthManager의
+# _ensure_refresh_thread와 같은 패턴)
+_listener_pid = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_listener() -> None:
+    """현재 프로세스에 리스너 스레드가 없으면 (재)시작합니다."""
+    global _listener_pid
+    with _listener_lock:
+        if os.getpid() == _listener_pid or _log_listener is None:
+            return
+        # QueueListener.start는 호출 시마다 새 스레드를 만들므로
+        # fork로 물려받은 리스너 객체를 자식에서 그대로 재사용합니다.
+        _log_listener.start()
+        _listener_pid = os.getpid()
+
+
+class _ForkAwareQueueHandler(QueueHandler):
+    """레코드를 큐에 넣기 전에 리스너 스레드 생존을 보장하는 핸들러.
+
+    fork된 자식 프로세스에는 부모의 리스너 스레드가 없어서, 그대로 두면
+    로그가 아무도 비우지 않는 큐에 쌓이기만 합니다(출력 유실 + 메모리 누수).
+    """
+
+    def emit(self, record):
+        if os.getpid() != _listener_pid:
+            _ensure_listener()
+        super().emit(record)
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """레코드마다 flush하지 않는 StreamHandler.
+
+    기본 StreamHandler.emit은 레코드마다 flush(= write syscall)를
+    호출합니다. 리스너가 버스트 단위로 flush하므로 여기서는 쓰기만 합니다.
+    """
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchQueueListener(QueueListener):
+    """큐를 버스트 단위로 비우고 flush는 버스트당 한 번만 수행하는 리스너.
+
+    재시도 루프 등에서 로그가 몰릴 때 레코드마다 깨어나 flush하는 대신,
+    쌓인 레코드를 한 번에 처리해 syscall과 컨텍스트 스위치를 줄입니다.
+    """
+
+    MAX_BATCH = 256
+
+    def _monitor(self):
+        q = self.queue
+        has_task_done = hasattr(q, "task_done")
+        while True:
+            # 첫 레코드는 블로킹으로 기다리고, 깨어난 김에 쌓인 것을
+            # MAX_BATCH까지 논블로킹으로 마저 비웁니다.
+            record = self.dequeue(True)
+            stop = record is self._sentinel
+            if not stop:
+                self.handle(record)
+            if has_task_done:
+                q.task_done()
+
+            batch = 1
+            while not stop and batch < self.MAX_BATCH:
+                try:
+                    record = self.dequeue(False)
+                except queue.Empty:
+                    break
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    self.handle(record)
+                batch += 1
+                if has_task_done:
+                    q.task_done()
+
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    pass
+
+            if stop:
+                break
 
 
 def setup_logging() -> logging.Logger:
     """
     통합 로깅 시스템 설정
-    
+
     환경 변수 LOG_LEVEL로 로그 레벨을 조정할 수 있습니다.
     기본값은 INFO입니다.
-    
+
+    요청 스레드가 포맷팅/콘솔 쓰기 syscall에 블로킹되지 않도록
+    QueueHandler로 레코드만 큐에 넣고, 백그라운드 QueueListener가
+    실제 포맷과 출력을 담당합니다.
+
     Returns:
         설정된 로거 인스턴스
     """
+    global _log_listener, _listener_pid
+
     # 환경 변수에서 로그 레벨 가져오기 (기본: INFO)
     log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
     numeric_level = getattr(logging, log_level, logging.INFO)
-    
-    # 로깅 기본 설정
+
+    # 포맷에 쓰지 않는 레코드 속성 수집을 끕니다.
+    # (레코드 생성마다 os.getpid()/threading.get_ident() 호출 제거)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    log_queue = queue.Queue(-1)
+    console_handler = _BufferedStreamHandler()  # 콘솔 출력 (flush는 리스너가 버스트당 1회)
+    console_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+
+    # 로깅 기본 설정: 요청 스레드는 큐에 넣기만 합니다.
+    # QueueHandler 쪽은 메시지 보간만 수행하고(%(message)s),
+    # 최종 포맷(asctime 등)은 리스너의 콘솔 핸들러가 담당합니다.
+    queue_handler = _ForkAwareQueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
     logging.basicConfig(
         level=numeric_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler()  # 콘솔 출력
-        ]
+        handlers=[queue_handler]
     )
-    
+
+    _log_listener = _BatchQueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    _listener_pid = os.getpid()
+    atexit.register(_log_listener.stop)
+
     # 외부 라이브러리 로그 레벨 조정 (너무 상세한 로그 억제)
     logging.getLogger('urllib3').setLevel(logging.WARNING)
     logging.getLogger('requests').setLevel(logging.WARNING)
-    
+
     return logging.getLogger(__name__)
 
 
@@ -16,6 +16,7 @@ from typing import Any, Dict, Generator, Iterable, List, Optional, Union
 
 from requests import Response
 
+from src.utils.jsonio import dumps_bytes, loads
 from src.utils.schema_sanitizer import SCHEMA_ALLOWED_KEYS, sanitize_schema
 from src.utils.text_extraction import ANTHROPIC_TEXT_KEYS, extract_text_from_content_value
 from src.utils.opencode_anthropic import (
@@ -64,6 +65,32 @@ CURSOR_INTERNAL_TOOL_ALIASES = {
 }
 
 
+# 내용이 고정된 SSE 이벤트는 스트림마다 json.dumps를 반복하지 않도록
+# import 시점에 한 번만 만들어 둡니다. index만 바뀌는 이벤트는 구조가
+# 고정돼 있어 %d 치환으로 충분합니다.
+_SSE_PING = 'event: ping\ndata: {"type":"ping"}\n\n'
+_SSE_MESSAGE_STOP = 'event: message_stop\ndata: {"type":"message_stop"}\n\n'
+_SSE_MESSAGE_DELTA_BY_STOP_REASON = {
+    reason: (
+        'event: message_delta\ndata: {"type":"message_delta",'
+        '"delta":{"stop_reason":"' + reason + '","stop_sequence":null},'
+        '"usage":{"output_tokens":0}}\n\n'
+    )
+    for reason in ("end_turn", "max_tokens", "tool_use")
+}
+_SSE_CONTENT_BLOCK_STOP_FMT = (
+    'event: content_block_stop\ndata: {"type":"content_block_stop","index":%d}\n\n'
+)
+_SSE_TEXT_BLOCK_START_FMT = (
+    'event: content_block_start\ndata: {"type":"content_block_start","index":%d,'
+    '"content_block":{"type":"text","text":""}}\n\n'
+)
+_SSE_THINKING_BLOCK_START_FMT = (
+    'event: content_block_start\ndata: {"type":"content_block_start","index":%d,'
+    '"content_block":{"type":"thinking","thinking":""}}\n\n'
+)
+
+
 _REDACTED_TOOL_MARKER_PATTERN = re.compile(
     r"<\|redacted[^>|]*[>|]?",
     re.IGNORECASE,
@@ -332,13 +359,12 @@ class AnthropicHandler:
         if not isinstance(content, list):
             return ""
 
-        text_parts: List[str] = []
-        for block in content:
-            if not isinstance(block, dict):
-                continue
-            if block.get("type") == "text":
-                text_parts.append(str(block.get("text", "")))
-        return "\n".join(text_parts)
+        # 중간 리스트 없이 제너레이터로 바로 join합니다
+        return "\n".join(
+            str(block.get("text", ""))
+            for block in content
+            if isinstance(block, dict) and block.get("type") == "text"
+        )
 
     @staticmethod
     def _normalize_image_block(block: Any) -> Optional[Dict[str, Any]]:
@@ -382,7 +408,7 @@ class AnthropicHandler:
             return messages
 
         removed = total_images - max_images
-        logging.warning(
+        logger.warning(
             f"[AnthropicHandler] 이미지 {total_images}개 > 최대 {max_images}개, "
             f"오래된 메시지에서 {removed}개 제거"
         )
@@ -843,8 +869,13 @@ class AnthropicHandler:
         request_tools = req.get("tools")
         normalized_tools = self._normalize_tools(request_tools)
 
+        # chat_messages는 _normalize_messages가 만든 새 리스트이므로
+        # 연결 리스트를 또 만들지 않고 앞에 system 메시지를 끼워 넣습니다.
+        # (긴 대화 기록에서 O(N) 복사를 한 번 줄입니다)
+        if system_messages:
+            chat_messages[:0] = system_messages
         final_messages = self._trim_excess_images(
-            system_messages + chat_messages, self.MAX_IMAGES_PER_REQUEST
+            chat_messages, self.MAX_IMAGES_PER_REQUEST
         )
 
         result: Dict[str, Any] = {
@@ -952,7 +983,9 @@ class AnthropicHandler:
         requested_model: str,
         tools_contract: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
-        data = resp if isinstance(resp, dict) else resp.json()
+        # resp.json() 대신 바이트를 바로 파싱합니다 (requests의 인코딩
+        # 추측 경로를 건너뛰고, orjson이 있으면 bytes를 직접 받습니다)
+        data = resp if isinstance(resp, dict) else loads(resp.content)
         if "choices" not in data or not isinstance(data.get("choices"), list):
             raise ValueError("Expected OpenAI-compatible response with choices")
 
@@ -982,25 +1015,24 @@ class AnthropicHandler:
     @staticmethod
     def _iter_stream_lines(
         resp: Union[Generator[str, None, None], Response],
-    ) -> Iterable[str]:
+    ) -> Iterable[bytes]:
+        """업스트림을 bytes 라인 단위로 순회합니다.
+
+        라인마다 str로 디코드하지 않고 bytes 그대로 yield합니다.
+        SSE 프레이밍(data: 접두사, [DONE])은 전부 ASCII라 bytes 비교로
+        충분하고, 실제 디코드는 JSON 파서(orjson은 bytes를 직접 받음)에
+        한 번만 맡깁니다.
+        """
         if inspect.isgenerator(resp):
             for chunk in resp:
                 if chunk is None:
                     continue
-                text = (
-                    chunk.decode("utf-8", errors="ignore")
-                    if isinstance(chunk, bytes)
-                    else str(chunk)
-                )
-                for line in text.splitlines():
+                data = chunk if isinstance(chunk, bytes) else str(chunk).encode("utf-8")
+                for line in data.splitlines():
                     yield line
             return
 
-        for line in resp.iter_lines():
-            if not line:
-                yield ""
-                continue
-            yield line.decode("utf-8", errors="ignore")
+        yield from resp.iter_lines()
 
     def stream_anthropic_response(
         self,
@@ -1037,7 +1069,12 @@ class AnthropicHandler:
         last_choice_summary = ""
 
         def sse(event: str, data: Dict[str, Any]) -> str:
-            return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+            # 토큰당 호출되는 핫 패스 - jsonio(orjson 폴백 포함)로 직렬화합니다
+            return (
+                "event: " + event + "\ndata: "
+                + dumps_bytes(data).decode("utf-8")
+                + "\n\n"
+            )
 
         def ensure_tool_block_started(
             block_index: int, state: Dict[str, Any]
@@ -1182,10 +1219,7 @@ class AnthropicHandler:
             # thinking block 종료
             if thinking_block_open:
                 events.append(
-                    sse(
-                        "content_block_stop",
-                        {"type": "content_block_stop", "index": current_index},
-                    )
+                    (_SSE_CONTENT_BLOCK_STOP_FMT % current_index)
                 )
                 thinking_block_open = False
                 if not text_block_open:
@@ -1200,10 +1234,7 @@ class AnthropicHandler:
                     text_char_count,
                 )
                 events.append(
-                    sse(
-                        "content_block_stop",
-                        {"type": "content_block_stop", "index": current_index},
-                    )
+                    (_SSE_CONTENT_BLOCK_STOP_FMT % current_index)
                 )
                 text_block_open = False
 
@@ -1219,10 +1250,7 @@ class AnthropicHandler:
                         len(state.get("arguments", "")),
                     )
                     events.append(
-                        sse(
-                            "content_block_stop",
-                            {"type": "content_block_stop", "index": block_index},
-                        )
+                        (_SSE_CONTENT_BLOCK_STOP_FMT % block_index)
                     )
                     state["stopped"] = True
                 elif state.get("arguments") and not state.get("name"):
@@ -1265,7 +1293,7 @@ class AnthropicHandler:
                 line_count += 1
                 gap = now - last_chunk_time
                 if gap > STREAM_PING_INTERVAL_SEC:
-                    yield sse("ping", {"type": "ping"})
+                    yield _SSE_PING
                     last_chunk_time = now
                 if gap > 5.0:
                     logger.warning(
@@ -1282,18 +1310,21 @@ class AnthropicHandler:
                     empty_line_count += 1
                     continue
 
-                if not line.startswith("data:"):
+                if not line.startswith(b"data:"):
                     logger.debug(
                         "[AnthropicStream] 비-data 라인 무시 | request_id=%s | sample=%s",
                         stream_id,
-                        line[:120],
+                        line[:120].decode("utf-8", errors="ignore"),
                     )
                     continue
 
                 data_line_count += 1
                 payload = line[5:].strip()
-                last_payload_sample = self._truncate_log_text(payload)
-                if payload == "[DONE]":
+                # 로그 샘플은 앞부분만 디코드합니다 (전체 디코드는 낭비)
+                last_payload_sample = self._truncate_log_text(
+                    payload[:400].decode("utf-8", errors="ignore")
+                )
+                if payload == b"[DONE]":
                     stream_done_received = True
                     logger.info(
                         "[AnthropicStream] [DONE] 수신 | request_id=%s | model=%s | elapsed=%.3fs",
@@ -1306,12 +1337,12 @@ class AnthropicHandler:
                     break
 
                 try:
-                    data = json.loads(payload)
-                except json.JSONDecodeError:
+                    data = loads(payload)
+                except ValueError:
                     logger.warning(
                         "[AnthropicStream] JSON 디코드 실패 | request_id=%s | payload_sample=%s",
                         stream_id,
-                        payload[:200],
+                        payload[:200].decode("utf-8", errors="ignore"),
                     )
                     continue
 
@@ -1352,14 +1383,7 @@ class AnthropicHandler:
                 reasoning = self._extract_stream_reasoning(choice)
                 if reasoning:
                     if not thinking_block_open:
-                        yield sse(
-                            "content_block_start",
-                            {
-                                "type": "content_block_start",
-                                "index": current_index,
-                                "content_block": {"type": "thinking", "thinking": ""},
-                            },
-                        )
+                        yield (_SSE_THINKING_BLOCK_START_FMT % current_index)
                         thinking_block_open = True
                     yield sse(
                         "content_block_delta",
@@ -1377,22 +1401,12 @@ class AnthropicHandler:
                     if bracket_tool_calls:
                         if visible_text:
                             if thinking_block_open:
-                                yield sse(
-                                    "content_block_stop",
-                                    {"type": "content_block_stop", "index": current_index},
-                                )
+                                yield (_SSE_CONTENT_BLOCK_STOP_FMT % current_index)
                                 thinking_block_open = False
                                 current_index += 1
                             text_char_count += len(visible_text)
                             if not text_block_open:
-                                yield sse(
-                                    "content_block_start",
-                                    {
-                                        "type": "content_block_start",
-                                        "index": current_index,
-                                        "content_block": {"type": "text", "text": ""},
-                                    },
-                                )
+                                yield (_SSE_TEXT_BLOCK_START_FMT % current_index)
                                 text_block_open = True
                             yield sse(
                                 "content_block_delta",
@@ -1403,10 +1417,7 @@ class AnthropicHandler:
                                 },
                             )
                         if text_block_open:
-                            yield sse(
-                                "content_block_stop",
-                                {"type": "content_block_stop", "index": current_index},
-                            )
+                            yield (_SSE_CONTENT_BLOCK_STOP_FMT % current_index)
                             text_block_open = False
                             current_index += 1
                         for tc_idx, tool_call in enumerate(bracket_tool_calls):
@@ -1439,10 +1450,7 @@ class AnthropicHandler:
                         continue
 
                     if thinking_block_open:
-                        yield sse(
-                            "content_block_stop",
-                            {"type": "content_block_stop", "index": current_index},
-                        )
+                        yield (_SSE_CONTENT_BLOCK_STOP_FMT % current_index)
                         thinking_block_open = False
                         current_index += 1
                     text_char_count += len(text)
@@ -1452,14 +1460,7 @@ class AnthropicHandler:
                             stream_id,
                             current_index,
                         )
-                        yield sse(
-                            "content_block_start",
-                            {
-                                "type": "content_block_start",
-                                "index": current_index,
-                                "content_block": {"type": "text", "text": ""},
-                            },
-                        )
+                        yield (_SSE_TEXT_BLOCK_START_FMT % current_index)
                         text_block_open = True
                     yield sse(
                         "content_block_delta",
@@ -1484,10 +1485,7 @@ class AnthropicHandler:
                             stream_id,
                             current_index,
                         )
-                        yield sse(
-                            "content_block_stop",
-                            {"type": "content_block_stop", "index": current_index},
-                        )
+                        yield (_SSE_CONTENT_BLOCK_STOP_FMT % current_index)
                         text_block_open = False
                         current_index += 1
 
@@ -1582,15 +1580,18 @@ class AnthropicHandler:
                     last_choice_summary,
                 )
 
-            yield sse(
-                "message_delta",
-                {
-                    "type": "message_delta",
-                    "delta": {"stop_reason": stop_reason, "stop_sequence": None},
-                    "usage": {"output_tokens": 0},
-                },
-            )
-            yield sse("message_stop", {"type": "message_stop"})
+            message_delta_event = _SSE_MESSAGE_DELTA_BY_STOP_REASON.get(stop_reason)
+            if message_delta_event is None:
+                message_delta_event = sse(
+                    "message_delta",
+                    {
+                        "type": "message_delta",
+                        "delta": {"stop_reason": stop_reason, "stop_sequence": None},
+                        "usage": {"output_tokens": 0},
+                    },
+                )
+            yield message_delta_event
+            yield _SSE_MESSAGE_STOP
             logger.info(
                 "[AnthropicStream] ✅ 종료 | request_id=%s | message_id=%s | model=%s | "
                 "done=%s | stop_reason=%s | chunks=%s | lines=%s | data_lines=%s | empty_lines=%s | "
@@ -15,6 +15,7 @@ from typing import Dict, Any, List, Optional
 import requests
 
 from src.core.errors import ProxyRequestError, ErrorHandler
+from src.services.response_cache import ResponseCache
 from src.providers.standard import StandardApiClient
 from src.providers.qwen import QwenApiClient
 from src.providers.google import GoogleApiClient
@@ -30,6 +31,8 @@ from src.utils.opencode_anthropic import (
     uses_opencode_anthropic_messages,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def _strip_quotes(value: str) -> str:
     """문자열 값에서 양쪽 따옴표를 제거합니다."""
@@ -41,6 +44,20 @@ def _strip_quotes(value: str) -> str:
 # Claude Code tool bridge: compact system prompt instead of full tools payload
 CURSOR_BRIDGE_PROVIDERS = frozenset({"cursor", "ccs"})
 
+# 비스트리밍 응답 캐시 (프로세스 전역, ChatHandler가 요청마다 생성되어도 공유됨)
+_response_cache = ResponseCache()
+
+# Cline 이미지 요청 형식: (앞 텍스트)(data:image...)(<environment_details>)(뒤 텍스트)
+# 한 번의 C 레벨 스캔으로 분리하기 위해 미리 컴파일합니다.
+_CLINE_IMAGE_PATTERN = re.compile(
+    r"(?s)^(.*?)data:image(.*?)<environment_details>(.*)$"
+)
+
+# 요청마다 dict 리터럴을 다시 만들지 않도록 미리 구성한 헤더 템플릿.
+# post_request가 Authorization 등을 추가하므로 사용 시 복사해서 넘깁니다.
+_BASE_HEADERS = {'Content-Type': 'application/json'}
+_CURSOR_BRIDGE_HEADERS = {'Content-Type': 'application/json', 'X-Cursor-Mode': 'agent'}
+
 
 class ChatHandler:
     """
@@ -67,6 +84,10 @@ class ChatHandler:
 
     COMPACTION_ENABLED = os.environ.get("ENABLE_COMPACTION", "true").lower() != "false"
 
+    # 동일 비스트리밍 요청 응답 캐시 (기본 비활성화 - 같은 프롬프트에 항상
+    # 같은 완성이 반환되므로 운영 환경에서 의도적으로 켜야 합니다)
+    RESPONSE_CACHE_ENABLED = os.environ.get("ENABLE_RESPONSE_CACHE", "false").lower() == "true"
+
     # 제공업체별 prefix와 base_url 매핑
     PROVIDER_CONFIG = {
         'google': {
@@ -339,7 +360,7 @@ class ChatHandler:
         if not long_context_model or long_context_model == requested_model:
             return None  # 재시도할 모델이 없음
 
-        logging.warning(
+        logger.warning(
             "[ContextOverflowFallback] %s → %s 재시도",
             requested_model, long_context_model
         )
@@ -372,7 +393,7 @@ class ChatHandler:
 
         long_context_model = self._find_long_context_model(requested_model)
         if long_context_model:
-            logging.info(
+            logger.info(
                 "[LongContextRouting] %s → %s (tokens: %d, threshold: %d)",
                 requested_model, long_context_model, estimated_tokens, threshold_tokens
             )
@@ -381,7 +402,7 @@ class ChatHandler:
             return req
 
         # fallback 없으면 에러 반환 (기존 compaction 동작 유지)
-        logging.warning(
+        logger.warning(
             "[LongContextRouting] fallback 모델 없음, compaction 필요: model=%s tokens=%d",
             requested_model, estimated_tokens
         )
@@ -399,20 +420,27 @@ class ChatHandler:
         Returns:
             (제공업체, 모델명, base_url) 튜플
         """
-        for prefix, config in self.PROVIDER_CONFIG.items():
-            if requested_model.startswith(f"{prefix}:"):
-                model = requested_model.replace(f'{prefix}:', '')
+        prefix, sep, model = requested_model.partition(':')
+        if sep:
+            config = self.PROVIDER_CONFIG.get(prefix)
+            if config is not None:
                 return prefix, model, config['base_url']
 
         # 매칭되는 제공업체가 없는 경우
         return None, requested_model, None
 
+    # prefix → 클라이언트 속성명 평탄화 테이블.
+    # 인스턴스를 직접 캐시하지 않고 getattr를 유지해 클라이언트 교체
+    # (테스트의 mock 주입 등)가 계속 동작하도록 합니다.
+    _CLIENT_ATTR_BY_PREFIX = {
+        prefix: cfg['client_attr'] for prefix, cfg in PROVIDER_CONFIG.items()
+    }
+
     def _get_client(self, provider: str):
         """제공업체에 해당하는 API 클라이언트를 반환합니다."""
-        if provider not in self.PROVIDER_CONFIG:
+        client_attr = self._CLIENT_ATTR_BY_PREFIX.get(provider)
+        if client_attr is None:
             raise ValueError(f"지원되지 않는 제공업체: {provider}")
-
-        client_attr = self.PROVIDER_CONFIG[provider]['client_attr']
         return getattr(self, client_attr)
 
     def _handle_opencode_anthropic_messages_request(
@@ -437,11 +465,11 @@ class ChatHandler:
             tool_choice=tool_choice,
         )
         endpoint = f"{base_url}/messages"
-        headers = {"Content-Type": "application/json"}
+        headers = dict(_BASE_HEADERS)
         client = self.opencode_client
         api_key = client._get_api_key()
         if not api_key:
-            logging.error("[OpenCode] Anthropic Messages API 키를 가져올 수 없습니다.")
+            logger.error("[OpenCode] Anthropic Messages API 키를 가져올 수 없습니다.")
             return None
         headers["x-api-key"] = api_key
 
@@ -511,21 +539,20 @@ class ChatHandler:
             if not isinstance(content, str) or 'data:image' not in content:
                 continue
 
-            # 이미지 데이터 분리
-            try:
-                split1 = content.split('data:image')
-                split2 = split1[1].split('<environment_details>')
+            # 이미지 데이터 분리 (단일 패스 정규식 매칭)
+            match = _CLINE_IMAGE_PATTERN.match(content)
+            if match is None:
+                logger.warning("이미지 처리 실패: 예상 형식과 불일치")
+                continue
 
-                text_data = split1[0] + split2[1]
-                image_data = 'data:image' + split2[0]
+            text_data = match.group(1) + match.group(3)
+            image_data = 'data:image' + match.group(2)
 
-                # OpenAI Vision API 형식으로 변환
-                message['content'] = [
-                    {'type': 'text', 'text': text_data},
-                    {'type': 'image_url', 'image_url': {'url': image_data}}
-                ]
-            except (IndexError, KeyError) as e:
-                logging.warning(f"이미지 처리 실패: {e}")
+            # OpenAI Vision API 형식으로 변환
+            message['content'] = [
+                {'type': 'text', 'text': text_data},
+                {'type': 'image_url', 'image_url': {'url': image_data}}
+            ]
 
     @staticmethod
     def _escape_cursor_xml(text: str) -> str:
@@ -800,6 +827,36 @@ class ChatHandler:
                 message['content'] = normalized_parts
 
     def handle_chat_request(self, req: Dict[str, Any]) -> Optional[requests.Response | Dict[str, Any] | ProxyRequestError]:
+        stream = req.get('stream', True)
+
+        # 비스트리밍 동일 요청 캐시 조회 (opt-in)
+        cache_key = None
+        if self.RESPONSE_CACHE_ENABLED and not stream:
+            cache_key = _response_cache.make_key(req)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "[ResponseCache] 캐시 적중: model=%s", req.get("model", "unknown")
+                )
+                return cached
+
+        resp = self._dispatch_chat_request(req)
+
+        if cache_key is not None:
+            cacheable = None
+            if isinstance(resp, dict) and not resp.get("error"):
+                cacheable = resp
+            elif isinstance(resp, requests.Response) and resp.status_code == 200:
+                try:
+                    cacheable = resp.json()
+                except ValueError:
+                    cacheable = None
+            if cacheable is not None:
+                _response_cache.put(cache_key, cacheable)
+
+        return resp
+
+    def _dispatch_chat_request(self, req: Dict[str, Any]) -> Optional[requests.Response | Dict[str, Any] | ProxyRequestError]:
         messages = req.get('messages')
         stream = req.get('stream', True)
         requested_model = req.get('model')
@@ -809,7 +866,7 @@ class ChatHandler:
         if messages:
             self._process_image_content(messages)
         else:
-            logging.warning("요청에 messages가 없습니다.")
+            logger.warning("요청에 messages가 없습니다.")
             return None
 
         routed = self._maybe_route_long_context(req)
@@ -825,12 +882,12 @@ class ChatHandler:
         provider, model, base_url = self._parse_model(requested_model)
 
         if not provider:
-            logging.error(f"지원되지 않는 모델: {requested_model}")
+            logger.error(f"지원되지 않는 모델: {requested_model}")
             return None
 
         removed_model_error = self._validate_provider_model(provider, model, requested_model)
         if removed_model_error is not None:
-            logging.warning("비활성화된 모델 요청 차단: %s", requested_model)
+            logger.warning("비활성화된 모델 요청 차단: %s", requested_model)
             return removed_model_error
 
         if provider == 'ollama-cloud':
@@ -894,9 +951,10 @@ class ChatHandler:
                 payload['reasoning_effort'] = reasoning_effort
 
         endpoint = f"{base_url}/chat/completions"
-        headers = {'Content-Type': 'application/json'}
         if provider in CURSOR_BRIDGE_PROVIDERS:
-            headers["X-Cursor-Mode"] = "agent"
+            headers = dict(_CURSOR_BRIDGE_HEADERS)
+        else:
+            headers = dict(_BASE_HEADERS)
 
         client = self._get_client(provider)
         return client.post_request(
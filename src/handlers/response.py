@@ -8,20 +8,32 @@ OpenAI 호환 API 응답을 Ollama 형식으로 변환합니다.
 
 import json
 import logging
+import os
 import time
-from datetime import datetime
 from typing import Generator, Optional, Dict, Any, Union, List, Tuple
 
 import requests
 from requests import Response
 
 from src.core.errors import ErrorHandler
+from src.utils.jsonio import dumps_bytes, loads
 from src.utils.text_extraction import CONTENT_TEXT_KEYS, extract_text_from_content_value, parse_tool_arguments
 from src.utils.thought_filter import ThoughtTagFilter
+from src.utils.timeutil import iso_now
 
 
 logger = logging.getLogger(__name__)
 
+# SSE 데이터 라인 접두사 (bytes 레벨 비교용)
+_SSE_DATA_PREFIX = b"data: "
+
+# 스트리밍 청크 병합(opt-in): 토큰당 한 번의 소켓 쓰기가 부담되는 환경에서
+# STREAM_COALESCE_BYTES를 양수로 설정하면 해당 크기 또는
+# STREAM_COALESCE_MS 간격까지 청크를 모아 한 번에 내보냅니다.
+# 기본값 0은 비활성화 - 토큰 단위 즉시 전달(TTFT 우선)을 유지합니다.
+_COALESCE_BYTES = int(os.environ.get("STREAM_COALESCE_BYTES", "0"))
+_COALESCE_INTERVAL = float(os.environ.get("STREAM_COALESCE_MS", "15")) / 1000.0
+
 
 class ResponseHandler:
     """
@@ -31,15 +43,18 @@ class ResponseHandler:
     스트리밍 응답과 비스트리밍 응답을 모두 처리합니다.
     """
 
-    def __init__(self) -> None:
-        self._thought_filter = ThoughtTagFilter()
-
     @staticmethod
-    def _build_base_chunk(model: str) -> Dict[str, Any]:
-        """기본 Ollama 청크 구조를 생성합니다."""
+    def _build_base_chunk(model: str, created_at: Optional[str] = None) -> Dict[str, Any]:
+        """기본 Ollama 청크 구조를 생성합니다.
+
+        created_at을 주면 타임스탬프 포맷팅을 반복하지 않습니다
+        (스트리밍에서는 응답 시작 시각을 전체 청크가 공유합니다).
+        """
+        if created_at is None:
+            created_at = iso_now()
         return {
             "model": model,
-            "created_at": datetime.utcnow().isoformat() + "Z",
+            "created_at": created_at,
         }
 
     @staticmethod
@@ -149,12 +164,69 @@ class ResponseHandler:
             tool_calls.append(tool_entry)
         return tool_calls
 
+    @staticmethod
+    def _coalesce_chunks(
+        generator: Generator[bytes, None, None],
+        max_bytes: int,
+        max_interval: float,
+    ) -> Generator[bytes, None, None]:
+        """청크를 max_bytes 또는 max_interval까지 모아 내보냅니다.
+
+        타이머 스레드 없이 다음 청크 도착 시점에만 시간 조건을 검사하므로,
+        업스트림이 멈춰 있는 동안 이미 모인 데이터가 지연되지는 않습니다
+        (마지막 청크는 제너레이터 종료 시 항상 플러시됩니다).
+        """
+        buf = bytearray()
+        last_flush = time.monotonic()
+        for chunk in generator:
+            buf += chunk
+            now = time.monotonic()
+            if len(buf) >= max_bytes or (now - last_flush) >= max_interval:
+                yield bytes(buf)
+                buf.clear()
+                last_flush = now
+        if buf:
+            yield bytes(buf)
+
+    def maybe_coalesce(
+        self, generator: Generator[bytes, None, None]
+    ) -> Generator[bytes, None, None]:
+        """STREAM_COALESCE_BYTES가 설정된 경우에만 병합 래퍼를 적용합니다."""
+        if _COALESCE_BYTES <= 0:
+            return generator
+        return self._coalesce_chunks(generator, _COALESCE_BYTES, _COALESCE_INTERVAL)
+
+    @staticmethod
+    def _iter_stream_lines(resp: Response) -> Generator[bytes, None, None]:
+        """
+        응답 본문을 bytes 라인 단위로 분리하는 제너레이터입니다.
+
+        requests.iter_lines의 내부 디코딩/버퍼 복사 단계를 건너뛰고,
+        iter_content로 받은 청크를 bytearray 버퍼에서 직접 자릅니다.
+        """
+        buf = bytearray()
+        # 64KB 상한: 이미 도착한 데이터를 적은 횟수의 read로 가져옵니다.
+        # (청크 전송에서는 도착분만 반환되므로 대기 시간이 늘지 않습니다)
+        for chunk in resp.iter_content(chunk_size=65536):
+            if not chunk:
+                continue
+            buf += chunk
+            while True:
+                nl = buf.find(b"\n")
+                if nl < 0:
+                    break
+                line = bytes(buf[:nl])
+                del buf[: nl + 1]
+                yield line
+        if buf:
+            yield bytes(buf)
+
     @staticmethod
     def _parse_stream_line(line: bytes) -> Union[Dict, str, None]:
         """
         스트림에서 한 줄을 파싱합니다.
 
-        SSE(Server-Sent Events) 형식을 처리합니다:
+        SSE(Server-Sent Events) 형식을 bytes 레벨에서 처리합니다:
         - 빈 줄: 무시
         - ":"로 시작: SSE 코멘트 (keep-alive 등), 무시
         - "data: ": 데이터 페이로드, JSON 파싱
@@ -169,39 +241,40 @@ class ResponseHandler:
         if not line:
             return None
 
-        decoded = line.decode("utf-8").strip()
+        line = line.strip()
 
         # 빈 줄 무시
-        if not decoded:
+        if not line:
             return None
 
         # SSE 코멘트 무시 (예: ": OPENROUTER PROCESSING")
         # SSE 표준에서 콜론으로 시작하는 줄은 코멘트로, 클라이언트가 무시해야 함
-        if decoded.startswith(":"):
+        if line.startswith(b":"):
             return None
 
         # SSE "data: " 접두사 제거
-        if decoded.startswith("data: "):
-            decoded = decoded[6:]  # len("data: ") == 6
+        if line.startswith(_SSE_DATA_PREFIX):
+            line = line[6:]  # len(b"data: ") == 6
 
         # 스트림 종료 신호
-        if decoded == "[DONE]":
+        if line == b"[DONE]":
             return "[DONE]"
 
         try:
-            return json.loads(decoded)
-        except json.JSONDecodeError:
+            return loads(line)
+        except ValueError:
             # SSE 코멘트가 아닌 알 수 없는 형식은 경고 로그
-            logger.warning(f"스트림에서 잘못된 JSON 수신: {decoded[:100]}")
+            logger.warning("스트림에서 잘못된 JSON 수신: %s", line[:100])
             return None
 
     def _extract_chunk_content(
-        self, chunk: Dict[str, Any]
+        self, chunk: Dict[str, Any], thought_filter: ThoughtTagFilter
     ) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
         """
         파싱된 청크에서 텍스트 내용과 종료 이유를 추출합니다.
 
         Gemini Thinking 모드에서 <thought>...</thought> 태그는 필터링합니다.
+        필터 상태는 스트림별 thought_filter 인스턴스가 가집니다.
 
         Returns:
             (텍스트 내용, tool_calls, 종료 이유) 튜플
@@ -223,28 +296,54 @@ class ResponseHandler:
                 if (
                     "<thought>" in text_content
                     or "</thought>" in text_content
-                    or self._thought_filter.in_thought_tag
+                    or thought_filter.in_thought_tag
                 ):
                     logger.info("[Thinking Mode] thought 태그 감지 - 필터링 수행")
-                    text_content = self._filter_thought_tags(text_content)
+                    text_content = thought_filter.filter(text_content)
 
         return text_content, tool_calls, finish_reason
 
-    def _filter_thought_tags(self, text: str) -> str:
-        """텍스트에서 <thought>...</thought> 태그 내용을 필터링합니다."""
-        return self._thought_filter.filter(text)
-
-    def _create_content_chunk(self, model: str, text: str) -> str:
-        """컨텐츠 청크 JSON 문자열을 생성합니다."""
-        chunk = self._build_base_chunk(model)
+    def _create_content_chunk(
+        self, model: str, text: str, created_at: Optional[str] = None
+    ) -> bytes:
+        """컨텐츠 청크 JSON bytes를 생성합니다."""
+        chunk = self._build_base_chunk(model, created_at)
         chunk.update({"message": {"role": "assistant", "content": text}, "done": False})
-        return json.dumps(chunk) + "\n"
+        return dumps_bytes(chunk) + b"\n"
+
+    @staticmethod
+    def _build_content_template(model: str, created_at: str) -> Tuple[bytes, bytes]:
+        """스트림당 불변인 컨텐츠 청크 부분을 미리 직렬화합니다.
+
+        model/created_at/done은 토큰마다 동일하므로 JSON 접두/접미 bytes를
+        스트림 시작 시 한 번만 만들고, 토큰마다 content 문자열 하나만
+        직렬화해 이어 붙입니다.
+        """
+        prefix = (
+            b'{"model":'
+            + dumps_bytes(model)
+            + b',"created_at":'
+            + dumps_bytes(created_at)
+            + b',"done":false,"message":{"role":"assistant","content":'
+        )
+        return prefix, b"}}\n"
+
+    @staticmethod
+    def _content_chunk_from_template(
+        template: Tuple[bytes, bytes], text: str
+    ) -> bytes:
+        """템플릿에 content만 채운 컨텐츠 청크 bytes를 만듭니다."""
+        prefix, suffix = template
+        return prefix + dumps_bytes(text) + suffix
 
     def _create_tool_call_chunk(
-        self, model: str, tool_calls: List[Dict[str, Any]]
-    ) -> str:
-        """툴 호출 청크 JSON 문자열을 생성합니다."""
-        chunk = self._build_base_chunk(model)
+        self,
+        model: str,
+        tool_calls: List[Dict[str, Any]],
+        created_at: Optional[str] = None,
+    ) -> bytes:
+        """툴 호출 청크 JSON bytes를 생성합니다."""
+        chunk = self._build_base_chunk(model, created_at)
         chunk.update(
             {
                 "message": {
@@ -255,13 +354,17 @@ class ResponseHandler:
                 "done": False,
             }
         )
-        return json.dumps(chunk) + "\n"
+        return dumps_bytes(chunk) + b"\n"
 
     def _create_final_chunk(
-        self, model: str, start_time: float, done_reason: Optional[str] = None
-    ) -> str:
-        """최종 청크 JSON 문자열을 생성합니다."""
-        chunk = self._build_base_chunk(model)
+        self,
+        model: str,
+        start_time: float,
+        done_reason: Optional[str] = None,
+        created_at: Optional[str] = None,
+    ) -> bytes:
+        """최종 청크 JSON bytes를 생성합니다."""
+        chunk = self._build_base_chunk(model, created_at)
         duration_ns = int((time.time() - start_time) * 1e9)
         chunk.update(
             {
@@ -273,16 +376,16 @@ class ResponseHandler:
         )
         if done_reason:
             chunk["done_reason"] = done_reason
-        return json.dumps(chunk) + "\n"
+        return dumps_bytes(chunk) + b"\n"
 
-    def _create_error_chunk(self, model: str, error: Exception) -> str:
-        """오류 청크 JSON 문자열을 생성합니다."""
+    def _create_error_chunk(self, model: str, error: Exception) -> bytes:
+        """오류 청크 JSON bytes를 생성합니다."""
         error_response = ErrorHandler.create_error_response(model, str(error))
-        return json.dumps(error_response) + "\n"
+        return dumps_bytes(error_response) + b"\n"
 
     def handle_streaming_response(
         self, resp: Response, requested_model: str, max_tokens: Optional[int] = None
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
         """
         스트리밍 응답을 처리하는 제너레이터입니다.
 
@@ -294,32 +397,46 @@ class ResponseHandler:
             max_tokens: 요청에서 지정한 최대 토큰 수
 
         Yields:
-            Ollama 형식의 JSON 청크 문자열
+            Ollama 형식의 JSON 청크 bytes
         """
         start_time = time.time()
+        # Ollama 의미상 created_at은 응답 시작 시각이므로 스트림당 한 번만 포맷합니다.
+        created_at = iso_now()
+        content_template = self._build_content_template(requested_model, created_at)
         first_chunk_time: Optional[float] = None
         last_chunk_time = start_time
-        response_closed = False
         stream_finished = False
         pending_tool_call_buffers: Dict[int, Dict[str, str]] = {}
 
-        # Gemini Thinking 태그 필터링 상태 초기화
-        self._thought_filter.reset()
+        # Gemini Thinking 태그 필터 - 동시 스트림이 상태를 공유하지 않도록
+        # 스트림마다 별도 인스턴스를 씁니다.
+        thought_filter = ThoughtTagFilter()
+
+        # 토큰마다 도는 루프이므로 자주 쓰는 메서드를 지역 변수로 미리
+        # 바인딩해 반복적인 self 속성 조회를 줄입니다.
+        # walltime은 벽시계(time.time)입니다 — start_time과 같은 기준이어야
+        # 경과 시간 계산이 맞으므로 time.monotonic으로 바꾸면 안 됩니다.
+        walltime = time.time
+        parse_line = self._parse_stream_line
+        extract_content = self._extract_chunk_content
+        content_from_template = self._content_chunk_from_template
 
         # 스트림 시작 로그
         logger.info(
-            f"[Stream] 📤 시작 | model={requested_model} | max_tokens={max_tokens}"
+            "[Stream] 📤 시작 | model=%s | max_tokens=%s", requested_model, max_tokens
         )
 
         try:
-            for line in resp.iter_lines():
-                now = time.time()
+            for line in self._iter_stream_lines(resp):
+                now = walltime()
 
                 # 청크 수신 상태 추적 - 5초간 수신 없음 경고
                 if now - last_chunk_time > 5.0:
                     logger.warning(
-                        f"[Stream] ⚠️ {now - last_chunk_time:.1f}초간 청크 수신 없음 | "
-                        f"model={requested_model} | elapsed={now - start_time:.1f}초"
+                        "[Stream] ⚠️ %.1f초간 청크 수신 없음 | model=%s | elapsed=%.1f초",
+                        now - last_chunk_time,
+                        requested_model,
+                        now - start_time,
                     )
                 last_chunk_time = now
 
@@ -328,11 +445,12 @@ class ResponseHandler:
                     first_chunk_time = now
                     first_chunk_latency = first_chunk_time - start_time
                     logger.info(
-                        f"[Stream] ⏱️ 첫 청크 | model={requested_model} | "
-                        f"latency={first_chunk_latency:.3f}초"
+                        "[Stream] ⏱️ 첫 청크 | model=%s | latency=%.3f초",
+                        requested_model,
+                        first_chunk_latency,
                     )
 
-                parsed = self._parse_stream_line(line)
+                parsed = parse_line(line)
 
                 if parsed is None:
                     continue
@@ -341,33 +459,38 @@ class ResponseHandler:
                         yield self._create_tool_call_chunk(
                             requested_model,
                             self._build_stream_tool_calls(pending_tool_call_buffers),
+                            created_at,
                         )
                     if not stream_finished:
-                        yield self._create_final_chunk(requested_model, start_time)
+                        yield self._create_final_chunk(
+                            requested_model, start_time, created_at=created_at
+                        )
                         stream_finished = True
                     break
 
                 text_content, delta_tool_calls, finish_reason = (
-                    self._extract_chunk_content(parsed)
+                    extract_content(parsed, thought_filter)
                 )
                 self._merge_stream_tool_calls(
                     pending_tool_call_buffers, delta_tool_calls
                 )
 
                 if text_content:
-                    yield self._create_content_chunk(requested_model, text_content)
+                    yield content_from_template(content_template, text_content)
 
                 # finish_reason 상세 분석 및 로깅
                 if finish_reason == "length":
                     logger.warning(
-                        f"[Finish] ⚠️ LENGTH 종료 | model={requested_model} | "
-                        f"max_tokens={max_tokens} |_reason: max_tokens 도달 또는 context 초과 가능성"
+                        "[Finish] ⚠️ LENGTH 종료 | model=%s | max_tokens=%s "
+                        "|_reason: max_tokens 도달 또는 context 초과 가능성",
+                        requested_model,
+                        max_tokens,
                     )
                 elif finish_reason == "stop":
-                    logger.info(f"[Finish] ✅ STOP 종료 | model={requested_model}")
+                    logger.info("[Finish] ✅ STOP 종료 | model=%s", requested_model)
                 elif finish_reason == "tool_calls":
                     logger.info(
-                        f"[Finish] 🔧 TOOL_CALLS 종료 | model={requested_model}"
+                        "[Finish] 🔧 TOOL_CALLS 종료 | model=%s", requested_model
                     )
 
                 if finish_reason in ("stop", "tool_calls", "length"):
@@ -375,10 +498,11 @@ class ResponseHandler:
                         yield self._create_tool_call_chunk(
                             requested_model,
                             self._build_stream_tool_calls(pending_tool_call_buffers),
+                            created_at,
                         )
                         pending_tool_call_buffers.clear()
                     yield self._create_final_chunk(
-                        requested_model, start_time, finish_reason
+                        requested_model, start_time, finish_reason, created_at
                     )
                     stream_finished = True
                     break
@@ -388,39 +512,57 @@ class ResponseHandler:
                     yield self._create_tool_call_chunk(
                         requested_model,
                         self._build_stream_tool_calls(pending_tool_call_buffers),
+                        created_at,
                     )
-                yield self._create_final_chunk(requested_model, start_time)
+                yield self._create_final_chunk(
+                    requested_model, start_time, created_at=created_at
+                )
 
             # 스트림 종료 로그
             total_duration = time.time() - start_time
             logger.info(
-                f"[Stream] ✅ 종료 | model={requested_model} | "
-                f"duration={total_duration:.3f}초"
+                "[Stream] ✅ 종료 | model=%s | duration=%.3f초",
+                requested_model,
+                total_duration,
             )
 
         except Exception as e:
             elapsed = time.time() - start_time
             logger.error(
-                f"[Exception] ❌ {type(e).__name__} | model={requested_model} | "
-                f"elapsed={elapsed:.3f}초 | message={str(e)}",
+                "[Exception] ❌ %s | model=%s | elapsed=%.3f초 | message=%s",
+                type(e).__name__,
+                requested_model,
+                elapsed,
+                str(e),
                 exc_info=True,
             )
 
             # 예외 유형별 상세 로깅
             if isinstance(e, requests.exceptions.Timeout):
-                logger.error(f"[Exception] ⏱️ 타임아웃 - upstream 응답 지연 가능성")
+                logger.error("[Exception] ⏱️ 타임아웃 - upstream 응답 지연 가능성")
             elif isinstance(e, requests.exceptions.ConnectionError):
-                logger.error(f"[Exception] 🔌 연결 오류 - 네트워크 또는 upstream 문제")
+                logger.error("[Exception] 🔌 연결 오류 - 네트워크 또는 upstream 문제")
 
             yield self._create_error_chunk(requested_model, e)
         finally:
-            if resp and not response_closed:
+            if resp is not None:
+                # finish_reason/[DONE]에서 break한 경우 본문이 일부만 소비된
+                # 상태입니다. 남은 바이트를 비워야 keep-alive 연결이 풀로
+                # 반환되어 다음 요청에서 TLS 재핸드셰이크를 피할 수 있습니다.
+                if stream_finished:
+                    raw = getattr(resp, "raw", None)
+                    if raw is not None:
+                        try:
+                            raw.drain_conn()
+                        except Exception as drain_err:
+                            logger.debug(
+                                "[Stream] 연결 드레인 실패 (무시): %s", drain_err
+                            )
                 resp.close()
-                response_closed = True
 
     def handle_google_streaming_response(
         self, resp: Generator[str, None, None], requested_model: str
-    ) -> Generator[str, None, None]:
+    ) -> Generator[bytes, None, None]:
         """
         Google 스트리밍 응답을 처리하는 제너레이터입니다.
 
@@ -432,10 +574,12 @@ class ResponseHandler:
             requested_model: 요청된 모델 이름
 
         Yields:
-            Ollama 형식의 JSON 청크 문자열
+            Ollama 형식의 JSON 청크 bytes
         """
         start_time = time.time()
-        self._thought_filter.reset()
+        created_at = iso_now()
+        content_template = self._build_content_template(requested_model, created_at)
+        thought_filter = ThoughtTagFilter()
         pending_tool_calls: Dict[int, Dict[str, str]] = {}
         stream_finished = False
 
@@ -447,14 +591,17 @@ class ResponseHandler:
                     yield self._create_tool_call_chunk(
                         requested_model,
                         self._build_stream_tool_calls(pending_tool_calls),
+                        created_at,
                     )
                 if not stream_finished:
-                    yield self._create_final_chunk(requested_model, start_time)
+                    yield self._create_final_chunk(
+                        requested_model, start_time, created_at=created_at
+                    )
                     stream_finished = True
                 break
             if sse_line.startswith("data: "):
                 try:
-                    chunk = json.loads(sse_line[6:])
+                    chunk = loads(sse_line[6:])
                     choices = chunk.get("choices", [])
                     if not choices:
                         continue
@@ -464,9 +611,11 @@ class ResponseHandler:
 
                     # thought 태그 필터링
                     if text:
-                        text = self._filter_thought_tags(text)
+                        text = thought_filter.filter(text)
                         if text:
-                            yield self._create_content_chunk(requested_model, text)
+                            yield self._content_chunk_from_template(
+                                content_template, text
+                            )
 
                     # tool call 조각 누적
                     self._merge_stream_tool_calls(
@@ -478,14 +627,15 @@ class ResponseHandler:
                             yield self._create_tool_call_chunk(
                                 requested_model,
                                 self._build_stream_tool_calls(pending_tool_calls),
+                                created_at,
                             )
                             pending_tool_calls.clear()
                         yield self._create_final_chunk(
-                            requested_model, start_time, finish_reason
+                            requested_model, start_time, finish_reason, created_at
                         )
                         stream_finished = True
                         break
-                except (json.JSONDecodeError, KeyError):
+                except (ValueError, KeyError):
                     continue
 
         if not stream_finished:
@@ -493,8 +643,11 @@ class ResponseHandler:
                 yield self._create_tool_call_chunk(
                     requested_model,
                     self._build_stream_tool_calls(pending_tool_calls),
+                    created_at,
                 )
-            yield self._create_final_chunk(requested_model, start_time)
+            yield self._create_final_chunk(
+                requested_model, start_time, created_at=created_at
+            )
 
     def handle_non_streaming_response(
         self, resp: Response, requested_model: str
@@ -512,7 +665,10 @@ class ResponseHandler:
             Ollama 형식의 응답 딕셔너리
         """
         try:
-            data = resp.json()
+            # 바이트를 바로 파싱합니다 (requests의 인코딩 추측 경로 생략).
+            # content가 없는 응답 객체(json()만 구현한 대역 등)는 기존 경로 유지.
+            raw = getattr(resp, "content", None)
+            data = loads(raw) if raw is not None else resp.json()
 
             # 응답에서 텍스트 추출
             text_content = ""
@@ -525,15 +681,14 @@ class ResponseHandler:
             # 응답에서 모델 이름 추출 (없으면 요청 모델 사용)
             response_model = data.get("model", requested_model)
 
-            # Gemini Thinking 태그 필터링
-            self._thought_filter.reset()
+            # Gemini Thinking 태그 필터링 (응답 단위의 새 필터 인스턴스)
             if text_content and (
                 "<thought>" in text_content or "</thought>" in text_content
             ):
                 logger.info(
                     "[Thinking Mode] 비스트리밍 응답에서 thought 태그 감지 - 필터링 수행"
                 )
-                text_content = self._filter_thought_tags(text_content)
+                text_content = ThoughtTagFilter().filter(text_content)
 
             # Ollama 형식 응답 생성
             response = self._build_base_chunk(response_model)
@@ -5,7 +5,9 @@ API 클라이언트 베이스 모듈
 모든 API 클라이언트의 공통 기능을 정의하는 추상 베이스 클래스입니다.
 """
 
+import json
 import logging
+import random
 import time
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
@@ -14,6 +16,12 @@ import requests
 
 from src.core.errors import ErrorHandler, ProxyRequestError
 
+# 프로세스 전역 커넥션 풀 (src.core.http에서 관리).
+# 기존 임포트 경로 호환을 위해 재노출합니다.
+from src.core.http import http_session
+
+logger = logging.getLogger(__name__)
+
 
 class BaseApiClient(ABC):
     """
@@ -25,7 +33,16 @@ class BaseApiClient(ABC):
     
     # API 요청 타임아웃 설정 (연결 타임아웃, 읽기 타임아웃)
     REQUEST_TIMEOUT = (50, 600)
-    
+
+    # 재시도 가능한 HTTP 상태 코드
+    # 401/403/429는 키 순환으로 복구될 수 있고, 나머지는 일시적 서버 오류입니다.
+    RETRYABLE_STATUS_CODES = frozenset({401, 403, 408, 429, 500, 502, 503, 504})
+
+    # 지수 백오프 설정: sleep = uniform(0, min(CAP, BASE * 2**try_count))
+    BACKOFF_BASE = 0.25
+    BACKOFF_CAP = 30.0
+
+
     def __init__(self, provider_name: str):
         """
         Args:
@@ -65,6 +82,18 @@ class BaseApiClient(ABC):
         """키 실패를 기록합니다. 기본 구현은 no-op 입니다."""
         return None
 
+    def _mark_key_success(self, api_key: str) -> None:
+        """키 성공을 기록합니다. 기본 구현은 no-op 입니다."""
+        return None
+
+    def _auth_header_for_key(self, api_key: str) -> str:
+        """키에 대한 Authorization 헤더 값을 반환합니다.
+
+        토큰이 오래 유지되는 구현체는 미리 결합된 값을 캐시해
+        요청마다 문자열 결합을 피할 수 있습니다.
+        """
+        return 'Bearer ' + api_key
+
     def _build_upstream_proxy_error(
         self,
         payload: Dict[str, Any],
@@ -117,11 +146,19 @@ class BaseApiClient(ABC):
         """
         try_count = 0
         auth_retry_done = False
-        
+
+        # 페이로드는 재시도와 무관하게 동일하므로 루프 밖에서 한 번만 직렬화합니다.
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+        # 호출자가 준 dict를 변경하지 않도록 진입 시 한 번만 복사합니다.
+        # (여러 요청이 헤더 템플릿을 공유해도 Authorization이 섞이지 않습니다)
+        headers = dict(headers)
+        headers.setdefault("Content-Type", "application/json")
+
         while try_count < max_retries:
             api_key = self._get_api_key()
             if not api_key:
-                logging.error(f"[{self.provider_name}] API 키를 가져올 수 없습니다.")
+                logger.error("[%s] API 키를 가져올 수 없습니다.", self.provider_name)
                 return None
 
             key_context = self._get_key_log_context(api_key)
@@ -131,20 +168,23 @@ class BaseApiClient(ABC):
                     f"{key}={value}" for key, value in key_context.items()
                 )
             
-            headers['Authorization'] = f'Bearer {api_key}'
+            headers['Authorization'] = self._auth_header_for_key(api_key)
             
             try:
-                resp = requests.post(
+                resp = http_session.post(
                     url,
                     headers=headers,
-                    json=payload,
+                    data=body,
                     stream=stream,
                     timeout=self.REQUEST_TIMEOUT
                 )
                 
                 # HTTP 상태 및 헤더 로깅
-                logging.info(
-                    f"[HTTP] 📥 응답 | status={resp.status_code} | provider={self.provider_name}{context_suffix}"
+                logger.info(
+                    "[HTTP] 📥 응답 | status=%s | provider=%s%s",
+                    resp.status_code,
+                    self.provider_name,
+                    context_suffix,
                 )
 
                 response_body = ""
@@ -152,9 +192,11 @@ class BaseApiClient(ABC):
                     response_body = resp.text
 
                 if ErrorHandler.is_context_overflow_response(resp.status_code, response_body):
-                    logging.warning(
-                        f"[{self.provider_name}] 컨텍스트 초과 응답 감지 - "
-                        f"URL: {url}{context_suffix}"
+                    logger.warning(
+                        "[%s] 컨텍스트 초과 응답 감지 - URL: %s%s",
+                        self.provider_name,
+                        url,
+                        context_suffix,
                     )
                     return ProxyRequestError(
                         model=str(payload.get("model", "unknown")),
@@ -166,9 +208,11 @@ class BaseApiClient(ABC):
 
                 if ErrorHandler.is_non_retryable_400(resp.status_code, response_body):
                     message = ErrorHandler.extract_error_message(response_body)
-                    logging.error(
-                        f"[{self.provider_name}] 재시도 불가 400 에러 - 즉시 실패 처리 | "
-                        f"message={message}{context_suffix}"
+                    logger.error(
+                        "[%s] 재시도 불가 400 에러 - 즉시 실패 처리 | message=%s%s",
+                        self.provider_name,
+                        message,
+                        context_suffix,
                     )
                     return ProxyRequestError(
                         model=str(payload.get("model", "unknown")),
@@ -184,9 +228,12 @@ class BaseApiClient(ABC):
                     response_body=response_body
                 )
                 if passthrough_error is not None:
-                    logging.warning(
-                        f"[{self.provider_name}] 업스트림 에러 즉시 전달 | "
-                        f"status={resp.status_code} | code={passthrough_error.error_code or '-'}{context_suffix}"
+                    logger.warning(
+                        "[%s] 업스트림 에러 즉시 전달 | status=%s | code=%s%s",
+                        self.provider_name,
+                        resp.status_code,
+                        passthrough_error.error_code or "-",
+                        context_suffix,
                     )
                     return passthrough_error
                 
@@ -197,12 +244,17 @@ class BaseApiClient(ABC):
                     x_ratelimit_remaining = resp.headers.get('X-RateLimit-Remaining', 'N/A')
                     retry_after_int = int(retry_after) if str(retry_after).isdigit() else None
                     self._mark_key_failure(api_key, is_rate_limit=True, retry_after=retry_after_int)
-                    logging.warning(
-                        f"[HTTP] 🚦 Rate Limit | provider={self.provider_name} | "
-                        f"retry_after={retry_after} | reset={x_ratelimit_reset} | "
-                        f"remaining={x_ratelimit_remaining}{context_suffix}"
+                    logger.warning(
+                        "[HTTP] 🚦 Rate Limit | provider=%s | retry_after=%s | "
+                        "reset=%s | remaining=%s%s",
+                        self.provider_name,
+                        retry_after,
+                        x_ratelimit_reset,
+                        x_ratelimit_remaining,
+                        context_suffix,
                     )
-                    logging.debug(f"[HTTP] Rate Limit 헤더: {dict(resp.headers)}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[HTTP] Rate Limit 헤더: %s", dict(resp.headers))
                     message = ErrorHandler.extract_error_message(response_body)
                     return ProxyRequestError(
                         model=str(payload.get("model", "unknown")),
@@ -213,27 +265,77 @@ class BaseApiClient(ABC):
                 
                 # 5xx 서버 오류 로깅
                 if 500 <= resp.status_code < 600:
-                    logging.error(
-                        f"[HTTP] ❌ 서버 오류 | status={resp.status_code} | "
-                        f"provider={self.provider_name}"
+                    logger.error(
+                        "[HTTP] ❌ 서버 오류 | status=%s | provider=%s",
+                        resp.status_code,
+                        self.provider_name,
                     )
                 
                 # 401 인증 실패 처리
+                # 실패 기록은 여기서 하지 않습니다. 복구에 실패하면 아래
+                # raise_for_status → except 경로에서 한 번 기록되는데,
+                # 여기서도 기록하면 401 한 번이 연속 실패 2회로 집계되어
+                # 서킷이 문서화된 임계치보다 일찍 열립니다.
                 if resp.status_code == 401 and not auth_retry_done:
-                    self._mark_key_failure(api_key)
-                    logging.warning(f"[{self.provider_name}] 401 Unauthorized - 인증 복구 시도")
+                    logger.warning("[%s] 401 Unauthorized - 인증 복구 시도", self.provider_name)
                     if self._on_auth_failure():
                         auth_retry_done = True
                         continue  # try_count 증가 없이 재시도
+
+                # 인증 복구에 성공했는데도 다시 401이면 같은 자격 증명으로
+                # 더 재시도해도 결과가 같으므로 즉시 실패 처리합니다.
+                # (키 순환형 클라이언트는 _on_auth_failure가 False라
+                #  auth_retry_done이 서지 않아 기존 순환 재시도를 유지합니다)
+                if resp.status_code == 401 and auth_retry_done:
+                    self._mark_key_failure(api_key)
+                    logger.error(
+                        "[%s] 인증 복구 후에도 401 지속 - 즉시 실패 처리%s",
+                        self.provider_name,
+                        context_suffix,
+                    )
+                    message = ErrorHandler.extract_error_message(response_body)
+                    return ProxyRequestError(
+                        model=str(payload.get("model", "unknown")),
+                        message=message or "Authentication failed",
+                        status_code=401,
+                        error_type="authentication_error",
+                    )
                 
                 resp.raise_for_status()
+                self._mark_key_success(api_key)
                 return resp
                 
             except requests.exceptions.RequestException as e:
                 self._log_request_error(url, api_key, e, try_count, max_retries)
-                time.sleep(1)
+                self._mark_key_failure(api_key)
+
+                # 재시도해도 성공할 수 없는 상태 코드는 즉시 실패 처리
+                error_response = getattr(e, "response", None)
+                if error_response is not None and error_response.status_code not in self.RETRYABLE_STATUS_CODES:
+                    status_code = error_response.status_code
+                    message = ErrorHandler.extract_error_message(error_response.text)
+                    return ProxyRequestError(
+                        model=str(payload.get("model", "unknown")),
+                        message=message or f"Upstream request failed with status {status_code}",
+                        status_code=status_code,
+                        error_type=ErrorHandler.extract_error_type(error_response.text) or "api_error",
+                        error_code=ErrorHandler.extract_error_code(error_response.text),
+                    )
+
                 try_count += 1
-        
+                # 지수 백오프 + full jitter: 고정 1초 대기로 워커를 묶어두지 않습니다.
+                delay = random.uniform(
+                    0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * (2 ** try_count))
+                )
+                # 서버가 Retry-After를 명시한 503이면 그 값을 우선합니다.
+                # (429는 위의 Rate Limit 분기에서 즉시 반환되므로
+                #  이 백오프 경로에 도달하지 않습니다)
+                if error_response is not None and error_response.status_code == 503:
+                    retry_after_header = error_response.headers.get("Retry-After")
+                    if retry_after_header and str(retry_after_header).isdigit():
+                        delay = min(self.BACKOFF_CAP, float(retry_after_header))
+                time.sleep(delay)
+
         return None
     
     def _log_request_error(
@@ -253,24 +355,23 @@ class BaseApiClient(ABC):
                 f"{key}={value}" for key, value in key_context.items()
             )
         
-        # 응답 본문 추출
+        # 응답 본문 추출 (hasattr 대신 getattr 한 번으로 조회)
         response_body = ''
-        if hasattr(error, 'response') and error.response is not None:
+        error_response = getattr(error, 'response', None)
+        if error_response is not None:
             try:
-                response_body = error.response.text[:500]  # 최대 500자
+                response_body = error_response.text[:500]  # 최대 500자
             except Exception:
                 response_body = 'Unable to read response body'
         
-        # 에러 메시지 생성
-        error_msg = ErrorHandler.handle_api_error(
-            provider=self.provider_name,
-            error=error,
-            api_key=api_key
-        )
-        
-        logging.error(
-            f"[{self.provider_name}] API 요청 실패 - "
-            f"URL: {url}, 에러: {str(error)}, 키: {masked_key}, "
-            f"응답: {response_body}, 재시도: {try_count + 1}/{max_retries}{context_suffix}"
+        logger.error(
+            "[%s] API 요청 실패 - URL: %s, 에러: %s, 키: %s, 응답: %s, 재시도: %s/%s%s",
+            self.provider_name,
+            url,
+            str(error),
+            masked_key,
+            response_body,
+            try_count + 1,
+            max_retries,
+            context_suffix,
         )
-        print(error_msg)  # 콘솔 출력 유지
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import json
 import logging
+import random
 import time
 import uuid
 from typing import Optional, Dict, Any, Generator, Union, List
@@ -8,6 +9,7 @@ from typing import Optional, Dict, Any, Generator, Union, List
 import requests
 
 from src.auth.key_rotator import KeyRotator
+from src.providers.base import http_session
 from src.utils.schema_sanitizer import (
     SCHEMA_ALLOWED_KEYS,
     GOOGLE_UNSUPPORTED_CONSTRAINT_KEYS,
@@ -15,6 +17,8 @@ from src.utils.schema_sanitizer import (
     sanitize_schema,
 )
 
+logger = logging.getLogger(__name__)
+
 
 _SCHEMA_TYPE_MAP = {
     "string": "STRING",
@@ -32,6 +36,11 @@ class GoogleApiClient:
     REQUEST_TIMEOUT = (50, 300)
     MAX_RETRIES = 10
 
+    # 재시도 가능한 상태 코드 및 지수 백오프 설정 (BaseApiClient와 동일한 정책)
+    RETRYABLE_STATUS_CODES = frozenset({401, 403, 408, 429, 500, 502, 503, 504})
+    BACKOFF_BASE = 0.25
+    BACKOFF_CAP = 30.0
+
     THINKING_LEVEL_MODELS = ("gemini-3",)
     THINKING_BUDGET_MODELS = ("gemini-2.5",)
     GEMINI_TEMPERATURE = 1.0
@@ -243,7 +252,7 @@ class GoogleApiClient:
     def _to_openai_response(self, google_resp: dict, model: str) -> dict:
         candidates = google_resp.get("candidates", [])
         usage = google_resp.get("usageMetadata", {})
-        logging.info(
+        logger.info(
             "[Google] non-stream response summary: model=%s candidates=%s usage=%s",
             model,
             len(candidates),
@@ -253,7 +262,7 @@ class GoogleApiClient:
         choices = []
         for i, candidate in enumerate(candidates):
             parts = candidate.get("content", {}).get("parts", [])
-            logging.info(
+            logger.info(
                 "[Google] candidate[%s] finishReason=%s parts=%s",
                 i,
                 candidate.get("finishReason"),
@@ -306,7 +315,7 @@ class GoogleApiClient:
         }
 
     def _stream_as_openai_sse(self, resp: requests.Response, model: str) -> Generator[str, None, None]:
-        logging.info("[Google] stream response started: model=%s", model)
+        logger.info("[Google] stream response started: model=%s", model)
         for line in resp.iter_lines():
             if not line:
                 continue
@@ -329,11 +338,13 @@ class GoogleApiClient:
 
             candidate = candidates[0]
             parts = candidate.get("content", {}).get("parts", [])
-            logging.info(
-                "[Google] stream chunk finishReason=%s parts=%s",
-                candidate.get("finishReason"),
-                json.dumps(parts, ensure_ascii=False)[:1000],
-            )
+            # parts 직렬화는 청크마다 발생하므로 로그 레벨이 꺼져 있으면 건너뜁니다.
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[Google] stream chunk finishReason=%s parts=%s",
+                    candidate.get("finishReason"),
+                    json.dumps(parts, ensure_ascii=False)[:1000],
+                )
             finish_reason_raw = candidate.get("finishReason", "")
             finish_reason = None
             if finish_reason_raw:
@@ -408,7 +419,7 @@ class GoogleApiClient:
         for try_count in range(self.MAX_RETRIES):
             api_key = self.key_rotator.get_next_key()
             if not api_key:
-                logging.error(f"[{self.provider_name}] API 키를 가져올 수 없습니다.")
+                logger.error("[%s] API 키를 가져올 수 없습니다.", self.provider_name)
                 return None
 
             headers = {
@@ -416,13 +427,17 @@ class GoogleApiClient:
                 "x-goog-api-key": api_key
             }
 
-            logging.info(
-                f"[KeyRotator] [{self.provider_name}] API_KEY_USED - "
-                f"key_ending: {api_key[-8:]}, 시도: {try_count + 1}/{self.MAX_RETRIES}"
+            logger.info(
+                "[KeyRotator] [%s] API_KEY_USED - key_ending: %s, 시도: %s/%s",
+                self.provider_name,
+                api_key[-8:],
+                try_count + 1,
+                self.MAX_RETRIES,
             )
 
             try:
-                resp = requests.post(
+                # 공용 커넥션 풀 사용: 재시도마다 TCP+TLS 핸드셰이크를 반복하지 않습니다.
+                resp = http_session.post(
                     url,
                     headers=headers,
                     json=payload,
@@ -430,19 +445,47 @@ class GoogleApiClient:
                     timeout=self.REQUEST_TIMEOUT
                 )
                 resp.raise_for_status()
+                self.key_rotator.mark_key_success(api_key)
                 return resp
 
             except requests.exceptions.RequestException as e:
                 response_body = ""
-                if hasattr(e, "response") and e.response is not None:
-                    response_body = e.response.text[:300]
+                error_response = getattr(e, "response", None)
+                if error_response is not None:
+                    response_body = error_response.text[:300]
+                self.key_rotator.mark_key_failure(
+                    key=api_key,
+                    is_rate_limit=(
+                        error_response is not None
+                        and error_response.status_code == 429
+                    ),
+                )
                 masked_key = api_key[:8] + "..." + api_key[-4:]
-                logging.error(
-                    f"[{self.provider_name}] API 요청 실패 - URL: {url}, "
-                    f"에러: {str(e)}, 키: {masked_key}, 응답: {response_body}, "
-                    f"시도: {try_count + 1}/{self.MAX_RETRIES}"
+                logger.error(
+                    "[%s] API 요청 실패 - URL: %s, 에러: %s, 키: %s, 응답: %s, 시도: %s/%s",
+                    self.provider_name,
+                    url,
+                    str(e),
+                    masked_key,
+                    response_body,
+                    try_count + 1,
+                    self.MAX_RETRIES,
+                )
+
+                # 재시도해도 성공할 수 없는 상태 코드는 즉시 실패 처리
+                if (
+                    error_response is not None
+                    and error_response.status_code not in self.RETRYABLE_STATUS_CODES
+                ):
+                    return None
+
+                # 지수 백오프 + full jitter
+                time.sleep(
+                    random.uniform(
+                        0,
+                        min(self.BACKOFF_CAP, self.BACKOFF_BASE * (2 ** (try_count + 1))),
+                    )
                 )
-                time.sleep(1)
 
         return None
 
@@ -12,6 +12,8 @@ from typing import Optional
 from .base import BaseApiClient
 from src.auth.qwen_oauth import QwenOAuthManager
 
+logger = logging.getLogger(__name__)
+
 
 class QwenApiClient(BaseApiClient):
     """
@@ -32,12 +34,20 @@ class QwenApiClient(BaseApiClient):
     def _get_api_key(self) -> Optional[str]:
         """현재 access_token을 반환합니다."""
         token = self.oauth_manager.get_access_token()
-        if token:
-            # 토큰 마지막 8자리만 로깅
+        # 요청마다 찍히는 로그라 DEBUG로만 남기고, 꺼져 있으면
+        # 슬라이싱/포매팅 비용 자체를 건너뜁니다.
+        if token and logger.isEnabledFor(logging.DEBUG):
             token_suffix = token[-8:] if len(token) >= 8 else "***"
-            logging.info(f"[QwenApiClient] 토큰 사용 - key_ending: {token_suffix}")
+            logger.debug("[QwenApiClient] 토큰 사용 - key_ending: %s", token_suffix)
         return token
     
+    def _auth_header_for_key(self, api_key: str) -> str:
+        """OAuth 매니저가 캐시한 Bearer 헤더를 재사용합니다."""
+        header = self.oauth_manager.get_bearer_header()
+        if header is not None:
+            return header
+        return super()._auth_header_for_key(api_key)
+
     def _on_auth_failure(self) -> bool:
         """
         인증 실패 시 토큰 갱신을 시도합니다.
@@ -45,11 +55,11 @@ class QwenApiClient(BaseApiClient):
         Returns:
             갱신 성공 시 True (재시도 진행), 실패 시 False
         """
-        logging.warning("[QwenApiClient] 401 Unauthorized - 토큰 갱신 시도")
+        logger.warning("[QwenApiClient] 401 Unauthorized - 토큰 갱신 시도")
         
         if self.oauth_manager.refresh_access_token():
-            logging.info("[QwenApiClient] 토큰 갱신 성공 - 재시도 진행")
+            logger.info("[QwenApiClient] 토큰 갱신 성공 - 재시도 진행")
             return True
         else:
-            logging.error("[QwenApiClient] 토큰 갱신 실패")
+            logger.error("[QwenApiClient] 토큰 갱신 실패")
             return False
@@ -33,15 +33,15 @@ class StandardApiClient(BaseApiClient):
         return self.key_rotator.get_next_key()
 
     def _get_key_log_context(self, api_key: str) -> dict[str, str]:
-        for index, current_key in enumerate(self.key_rotator.api_keys):
-            if current_key != api_key:
-                continue
+        context = self.key_rotator.get_key_context(api_key)
+        if context is None:
             return {
-                "key_index": str(index),
-                "key_hash": self.key_rotator._hash_key(current_key)
+                "key_hash": "unknown"
             }
+        index, key_hash = context
         return {
-            "key_hash": "unknown"
+            "key_index": str(index),
+            "key_hash": key_hash
         }
 
     def _mark_key_failure(self, api_key: str, is_rate_limit: bool = False, retry_after: Optional[int] = None) -> None:
@@ -50,6 +50,9 @@ class StandardApiClient(BaseApiClient):
             is_rate_limit=is_rate_limit,
             retry_after=retry_after
         )
+
+    def _mark_key_success(self, api_key: str) -> None:
+        self.key_rotator.mark_key_success(api_key)
     
     def _on_auth_failure(self) -> bool:
         """
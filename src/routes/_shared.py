@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+라우트 공통 헬퍼 모듈
+
+여러 라우트 블루프린트가 공유하는 앱 단위 핸들러 캐싱 로직을 정의합니다.
+"""
+
+from flask import current_app
+
+from src.handlers.chat import ChatHandler
+
+
+def get_chat_handler() -> ChatHandler:
+    """앱 단위로 캐시된 ChatHandler를 반환합니다.
+
+    ChatHandler 생성은 제공업체별 클라이언트 구성을 동반하므로
+    요청마다 반복하지 않고 첫 요청에서 만들어 재사용합니다.
+    """
+    handler = current_app.config.get("chat_handler")
+    if handler is None:
+        handler = ChatHandler(current_app.config["api_config"])
+        current_app.config["chat_handler"] = handler
+    return handler
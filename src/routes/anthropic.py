@@ -16,10 +16,11 @@ from typing import Any, Dict, List
 from urllib.parse import parse_qs, unquote, urlparse
 
 import requests
-from flask import Blueprint, Response, current_app, request, stream_with_context
+from flask import Blueprint, Response, g, request, stream_with_context
 
 from src.core.errors import ProxyRequestError
-from src.handlers import AnthropicHandler, ChatHandler
+from src.handlers import AnthropicHandler
+from src.routes._shared import get_chat_handler
 from src.utils.advisor_emulation import (
     build_advisor_error_block,
     build_advisor_result_block,
@@ -28,6 +29,7 @@ from src.utils.advisor_emulation import (
     is_advisor_forced_request,
     resolve_advisor_model,
 )
+from src.utils.jsonio import dumps_bytes
 from src.utils.opencode_anthropic import AnthropicMessagePassthrough, AnthropicSsePassthrough
 
 
@@ -35,12 +37,24 @@ logger = logging.getLogger(__name__)
 
 anthropic_bp = Blueprint('anthropic', __name__, url_prefix='/v1')
 
+
 SSE_STREAM_HEADERS = {
     "Cache-Control": "no-cache",
     "Connection": "keep-alive",
     "X-Accel-Buffering": "no",
 }
 
+# 고정 에러 본문은 import 시점에 한 번만 직렬화합니다 (openai 라우트와 동일).
+_ERROR_MODEL_REQUIRED = json.dumps(
+    {"type": "error", "error": {"type": "invalid_request_error", "message": "model is required"}}
+).encode()
+_ERROR_MESSAGES_REQUIRED = json.dumps(
+    {"type": "error", "error": {"type": "invalid_request_error", "message": "messages is required"}}
+).encode()
+_ERROR_API_FAILED = json.dumps(
+    {"type": "error", "error": {"type": "api_error", "message": "API request failed"}}
+).encode()
+
 
 def _extract_text_content(content: Any) -> str:
     if isinstance(content, str):
@@ -284,7 +298,7 @@ def _handle_local_web_search(req: Dict[str, Any]) -> Response | None:
     return Response(json.dumps(body, ensure_ascii=False), status=200, mimetype="application/json")
 
 
-def _handle_local_advisor(req: Dict[str, Any], api_config: Any) -> Response | None:
+def _handle_local_advisor(req: Dict[str, Any]) -> Response | None:
     """advisor 강제 호출 요청을 ADVISOR_MODEL로 별도 처리"""
     if not is_advisor_forced_request(req):
         return None
@@ -295,7 +309,7 @@ def _handle_local_advisor(req: Dict[str, Any], api_config: Any) -> Response | No
     advisor_model = resolve_advisor_model()
 
     anthropic_handler = AnthropicHandler()
-    chat_handler = ChatHandler(api_config)
+    chat_handler = get_chat_handler()
 
     # 1. advisor 모델 호출용 payload 빌드 (tools/tool_choice 제외)
     proxied = anthropic_handler.build_proxy_request({
@@ -392,29 +406,25 @@ def messages():
     """Anthropic Messages API 호환 엔드포인트"""
     request_id = request.headers.get("x-request-id") or f"anth_{uuid.uuid4().hex[:12]}"
 
-    req = request.get_json(force=True)
+    # before_request 훅이 jsonio로 미리 파싱해 둔 본문
+    # (팩토리 없이 블루프린트만 등록한 앱에서는 기존 경로 사용)
+    req = g.get("json_body")
+    if req is None:
+        req = request.get_json(force=True)
     local_web_search_response = _handle_local_web_search(req)
     if local_web_search_response is not None:
         return local_web_search_response
 
-    api_config = current_app.config['api_config']
-    local_advisor_response = _handle_local_advisor(req, api_config)
+    local_advisor_response = _handle_local_advisor(req)
     if local_advisor_response is not None:
         return local_advisor_response
 
-    chat_handler = ChatHandler(api_config)
+    chat_handler = get_chat_handler()
     anthropic_handler = AnthropicHandler()
 
     requested_model = req.get('model')
     if not requested_model:
-        error_body = {
-            "type": "error",
-            "error": {
-                "type": "invalid_request_error",
-                "message": "model is required"
-            }
-        }
-        return Response(json.dumps(error_body), status=400, mimetype='application/json')
+        return Response(_ERROR_MODEL_REQUIRED, status=400, mimetype='application/json')
 
     logger.info(
         "Anthropic /v1/messages request: request_id=%s model=%s stream=%s tools=%s tool_choice=%s",
@@ -428,26 +438,12 @@ def messages():
     proxied_req = anthropic_handler.build_proxy_request(req)
     tools_contract = proxied_req.pop('_tools_contract', None)
     if not proxied_req.get('messages'):
-        error_body = {
-            "type": "error",
-            "error": {
-                "type": "invalid_request_error",
-                "message": "messages is required"
-            }
-        }
-        return Response(json.dumps(error_body), status=400, mimetype='application/json')
+        return Response(_ERROR_MESSAGES_REQUIRED, status=400, mimetype='application/json')
 
     resp = chat_handler.handle_chat_request(proxied_req)
     if resp is None:
         logger.error("Anthropic upstream request failed before streaming: request_id=%s model=%s", request_id, requested_model)
-        error_body = {
-            "type": "error",
-            "error": {
-                "type": "api_error",
-                "message": "API request failed"
-            }
-        }
-        return Response(json.dumps(error_body), status=500, mimetype='application/json')
+        return Response(_ERROR_API_FAILED, status=500, mimetype='application/json')
 
     if isinstance(resp, ProxyRequestError):
         logger.warning(
@@ -510,4 +506,5 @@ def messages():
         }
         return Response(json.dumps(error_body), status=500, mimetype='application/json')
 
-    return Response(json.dumps(response_body), status=200, mimetype='application/json')
+    # 큰 완료 응답이 지나는 경로이므로 jsonio(orjson 폴백)로 직렬화합니다
+    return Response(dumps_bytes(response_body), status=200, mimetype='application/json')
@@ -5,39 +5,93 @@ Ollama 호환 API 라우트
 /api/chat, /api/tags, /api/version 등 Ollama 스타일 엔드포인트를 정의합니다.
 """
 
-import datetime
 import inspect
 import json
 import logging
 import os
-from flask import Blueprint, request, Response, stream_with_context, current_app
+from flask import Blueprint, g, request, Response, stream_with_context
 
 from src.core.errors import ProxyRequestError
-from src.handlers.chat import ChatHandler
 from src.handlers.response import ResponseHandler
+from src.routes._shared import get_chat_handler
+from src.utils.timeutil import iso_now
 
 
 logger = logging.getLogger(__name__)
 response_handler = ResponseHandler()
 
+# 스트리밍 응답 공통 헤더: 리버스 프록시(nginx)가 NDJSON 스트림을
+# 버퍼링해 TTFB를 망치지 않도록 합니다. (openai/anthropic 라우트와 동일)
+_STREAMING_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
 # Blueprint 생성
 ollama_bp = Blueprint("ollama", __name__)
 
+_MODELS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "models.json"
+)
+
+# models.json이 없을 때 사용하는 기본 목록
+_DEFAULT_MODELS = [
+    {
+        "name": "google:gemini-3.1-flash-lite-preview",
+        "model": "google:gemini-3.1-flash-lite-preview",
+    },
+    {"name": "google:gemini-2.5-flash", "model": "google:gemini-2.5-flash"},
+    {
+        "name": "openrouter:mistralai/devstral-2512:free",
+        "model": "openrouter:mistralai/devstral-2512:free",
+    },
+    {"name": "cohere:command-a-03-2025", "model": "cohere:command-a-03-2025"},
+    {"name": "qwen:qwen3-coder-plus", "model": "qwen:qwen3-coder-plus"},
+]
+
+# /api/version 응답은 완전히 정적이므로 import 시점에 직렬화해 둡니다.
+_VERSION_BODY = json.dumps({"version": "0.1.0-openai-proxy"}).encode()
+
+# 고정 에러 본문도 미리 직렬화해 둡니다.
+_ERROR_API_FAILED = json.dumps({"error": "API request failed"}).encode()
+
+# /api/tags 응답 캐시: models.json의 mtime이 바뀔 때만 다시 직렬화합니다.
+_tags_cache = {"mtime": None, "models": None, "body": None}
+
 
 def _load_models() -> list:
     """models.json 파일에서 모델 목록을 로드합니다."""
-    models_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "models.json"
-    )
     try:
-        with open(models_path, "r") as f:
+        with open(_MODELS_PATH, "r") as f:
             data = json.load(f)
             return data.get("models", [])
     except (FileNotFoundError, json.JSONDecodeError) as e:
-        logger.warning(f"models.json 로드 실패, 기본 목록 사용: {e}")
+        logger.warning("models.json 로드 실패, 기본 목록 사용: %s", e)
         return []
 
 
+def get_cached_models() -> list:
+    """mtime 기반으로 캐시된 모델 목록을 반환합니다."""
+    _refresh_tags_cache()
+    return _tags_cache["models"]
+
+
+def _refresh_tags_cache() -> None:
+    """models.json이 변경됐으면 모델 목록과 직렬화 본문을 갱신합니다."""
+    try:
+        mtime = os.path.getmtime(_MODELS_PATH)
+    except OSError:
+        mtime = None
+
+    if _tags_cache["body"] is not None and _tags_cache["mtime"] == mtime:
+        return
+
+    models = _load_models() or _DEFAULT_MODELS
+    _tags_cache["models"] = models
+    _tags_cache["body"] = json.dumps({"models": models}).encode()
+    _tags_cache["mtime"] = mtime
+
+
 @ollama_bp.route("/", methods=["GET"])
 @ollama_bp.route("/api/version", methods=["GET"])
 def get_version():
@@ -46,11 +100,9 @@ def get_version():
 
     Ollama의 /api/version 및 루트 경로(/)를 모방합니다.
     """
-    logger.info("버전 정보 요청 수신")
-    version_response = {"version": "0.1.0-openai-proxy"}
-    return Response(
-        json.dumps(version_response), status=200, mimetype="application/json"
-    )
+    # Ollama 클라이언트가 고빈도로 폴링하는 경로이므로 DEBUG로만 남깁니다.
+    logger.debug("버전 정보 요청 수신")
+    return Response(_VERSION_BODY, status=200, mimetype="application/json")
 
 
 @ollama_bp.route("/api/tags", methods=["GET"])
@@ -61,26 +113,8 @@ def get_tags():
     Ollama의 /api/tags 엔드포인트를 모방합니다.
     models.json 파일에서 모델 목록을 로드합니다.
     """
-    models = _load_models()
-
-    # models.json이 없으면 기본 목록 반환
-    if not models:
-        models = [
-            {
-                "name": "google:gemini-3.1-flash-lite-preview",
-                "model": "google:gemini-3.1-flash-lite-preview",
-            },
-            {"name": "google:gemini-2.5-flash", "model": "google:gemini-2.5-flash"},
-            {
-                "name": "openrouter:mistralai/devstral-2512:free",
-                "model": "openrouter:mistralai/devstral-2512:free",
-            },
-            {"name": "cohere:command-a-03-2025", "model": "cohere:command-a-03-2025"},
-            {"name": "qwen:qwen3-coder-plus", "model": "qwen:qwen3-coder-plus"},
-        ]
-
-    response = {"models": models}
-    return Response(json.dumps(response), status=200, mimetype="application/json")
+    _refresh_tags_cache()
+    return Response(_tags_cache["body"], status=200, mimetype="application/json")
 
 
 @ollama_bp.route("/api/chat", methods=["POST"])
@@ -93,18 +127,20 @@ def chat():
 
     스트리밍/비스트리밍 모드를 모두 지원합니다.
     """
-    api_config = current_app.config["api_config"]
-    chat_handler = ChatHandler(api_config)
-    req = request.get_json(force=True)
+    chat_handler = get_chat_handler()
+    # before_request 훅이 jsonio로 미리 파싱해 둔 본문
+    # (팩토리 없이 블루프린트만 등록한 앱에서는 기존 경로 사용)
+    req = g.get("json_body")
+    if req is None:
+        req = request.get_json(force=True)
     requested_model = req.get("model")
     stream = req.get("stream", True)
 
     # API 요청 처리
     resp = chat_handler.handle_chat_request(req)
     if resp is None:
-        error_response = {"error": "API request failed"}
         return Response(
-            json.dumps(error_response), status=500, mimetype="application/json"
+            _ERROR_API_FAILED, status=500, mimetype="application/json"
         )
 
     if isinstance(resp, ProxyRequestError):
@@ -129,26 +165,35 @@ def chat():
             message["tool_calls"] = tool_calls
         ollama_response = {
             "model": requested_model,
-            "created_at": datetime.datetime.utcnow().isoformat() + "Z",
+            "created_at": iso_now(),
             "message": message,
             "done": True,
         }
         return Response(json.dumps(ollama_response), mimetype="application/json")
 
     if stream and inspect.isgenerator(resp):
-        generator = response_handler.handle_google_streaming_response(resp, requested_model)
+        generator = response_handler.maybe_coalesce(
+            response_handler.handle_google_streaming_response(resp, requested_model)
+        )
         return Response(
             stream_with_context(generator),
             mimetype="application/x-ndjson",
+            headers=_STREAMING_HEADERS,
         )
 
     # 스트리밍/비스트리밍 응답 처리
     if stream:
         max_tokens = req.get("max_tokens")
-        generator = response_handler.handle_streaming_response(
-            resp, requested_model, max_tokens
+        generator = response_handler.maybe_coalesce(
+            response_handler.handle_streaming_response(
+                resp, requested_model, max_tokens
+            )
+        )
+        return Response(
+            stream_with_context(generator),
+            mimetype="application/x-ndjson",
+            headers=_STREAMING_HEADERS,
         )
-        return Response(stream_with_context(generator), mimetype="application/x-ndjson")
     else:
         ollama_response = response_handler.handle_non_streaming_response(
             resp, requested_model
@@ -8,10 +8,10 @@ OpenAI 호환 API 라우트
 import inspect
 import json
 import logging
-from flask import Blueprint, request, Response, stream_with_context, current_app
+from flask import Blueprint, g, request, Response, stream_with_context
 
 from src.core.errors import ProxyRequestError
-from src.handlers.chat import ChatHandler
+from src.routes._shared import get_chat_handler
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,14 @@ logger = logging.getLogger(__name__)
 # Blueprint 생성
 openai_bp = Blueprint('openai', __name__, url_prefix='/v1')
 
+# 고정 에러 본문은 import 시점에 한 번만 직렬화합니다.
+_ERROR_MODEL_REQUIRED = json.dumps(
+    {"error": {"message": "model is required", "type": "invalid_request_error"}}
+).encode()
+_ERROR_API_FAILED = json.dumps(
+    {"error": {"message": "API request failed", "type": "api_error"}}
+).encode()
+
 
 @openai_bp.route('/models', methods=['GET'])
 def list_models():
@@ -27,22 +35,20 @@ def list_models():
     
     OpenAI의 /v1/models 엔드포인트를 모방합니다.
     """
-    # 내부적으로 /api/tags 응답을 가져와서 변환
-    from src.routes.ollama import get_tags
-    
+    # mtime 기반 캐시에서 직접 가져옵니다
+    # (Flask Response 생성 후 json.loads로 되돌리는 왕복을 피합니다)
+    from src.routes.ollama import get_cached_models
+
     try:
-        tags_resp = get_tags()
-        data = json.loads(tags_resp.get_data(as_text=True))
+        models = get_cached_models()
     except Exception as e:
         logger.error(f"모델 목록 로드 실패: {e}")
         empty_response = {"object": "list", "data": []}
         return Response(
-            json.dumps(empty_response), 
-            status=200, 
+            json.dumps(empty_response),
+            status=200,
             mimetype='application/json'
         )
-
-    models = data.get("models", [])
     result = {
         "object": "list",
         "data": []
@@ -74,22 +80,19 @@ def chat_completions():
     OpenAI의 /v1/chat/completions 엔드포인트를 모방합니다.
     요청을 백엔드 API로 프록시하고 응답을 그대로 반환합니다.
     """
-    api_config = current_app.config['api_config']
-    chat_handler = ChatHandler(api_config)
+    chat_handler = get_chat_handler()
 
-    req = request.get_json(force=True)
+    # before_request 훅이 jsonio로 미리 파싱해 둔 본문
+    # (팩토리 없이 블루프린트만 등록한 앱에서는 기존 경로 사용)
+    req = g.get("json_body")
+    if req is None:
+        req = request.get_json(force=True)
     requested_model = req.get('model')
     
     # 모델 필수 검증
     if not requested_model:
-        error_body = {
-            "error": {
-                "message": "model is required",
-                "type": "invalid_request_error"
-            }
-        }
         return Response(
-            json.dumps(error_body), 
+            _ERROR_MODEL_REQUIRED,
             status=400, 
             mimetype='application/json'
         )
@@ -110,14 +113,8 @@ def chat_completions():
     # API 요청 처리
     resp = chat_handler.handle_chat_request(proxied_req)
     if resp is None:
-        error_body = {
-            "error": {
-                "message": "API request failed",
-                "type": "api_error"
-            }
-        }
         return Response(
-            json.dumps(error_body),
+            _ERROR_API_FAILED,
             status=500,
             mimetype='application/json'
         )
@@ -156,7 +153,11 @@ def chat_completions():
     if stream:
         def generate():
             try:
-                for chunk in resp.iter_content(chunk_size=None):
+                # chunk_size=None은 업스트림 HTTP 청크 단위(SSE 이벤트당
+                # 수십~수백 바이트)로 yield돼 이벤트마다 syscall이 발생합니다.
+                # 64KB 상한을 주면 이미 도착한 데이터를 묶어 전달하면서도
+                # 청크 전송 특성상 대기 시간은 늘어나지 않습니다.
+                for chunk in resp.iter_content(chunk_size=65536):
                     if chunk:
                         yield chunk
             finally:
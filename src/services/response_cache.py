@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+응답 캐시 모듈
+
+동일한 비스트리밍 채팅 요청의 완성 응답을 메모리에 캐싱하여
+업스트림 HTTP 왕복과 API 키 소모를 줄입니다.
+
+도구 재시도, 반복 질의 등 완전히 동일한 요청에 대해서만 동작하는
+정확 일치(exact-match) 캐시입니다. 스트리밍 요청은 캐싱하지 않습니다.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """
+    LRU + TTL 기반 비스트리밍 응답 캐시
+
+    요청 딕셔너리 전체(stream 플래그 제외)를 정규화 해시하여 키로
+    사용합니다. 프로세스 내 캐시이므로 gunicorn 워커별로 독립적입니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 300.0):
+        """
+        Args:
+            maxsize: 최대 캐시 항목 수 (초과 시 LRU 제거)
+            ttl_seconds: 항목 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    @staticmethod
+    def make_key(req: Dict[str, Any]) -> str:
+        """요청 딕셔너리에서 정규화된 캐시 키를 생성합니다.
+
+        stream 플래그만 제외하고 요청 전체를 해시합니다. 특정 필드만
+        고르면 thinking_level/reasoning_effort처럼 업스트림 페이로드에
+        반영되는 필드가 누락될 때 서로 다른 요청이 충돌하기 때문입니다.
+        """
+        material = {k: v for k, v in req.items() if k != "stream"}
+        serialized = json.dumps(
+            material, sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시에서 응답을 조회합니다. 만료되었으면 제거 후 None을 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, response = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        """응답을 캐시에 저장합니다."""
+        with self._lock:
+            self._entries[key] = (time.time(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+JSON 직렬화 유틸리티 모듈
+
+스트리밍 핫 패스용 JSON 인코딩/디코딩을 제공합니다.
+orjson이 설치되어 있으면 C 구현(3~10배 빠르고 bytes를 직접 반환)을 사용하고,
+없으면 표준 json으로 동작이 동일하게 폴백합니다.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 설치 환경에 따라 달라짐
+    orjson = None
+
+
+if orjson is not None:
+    def dumps_bytes(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON bytes로 직렬화합니다."""
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+else:
+    def dumps_bytes(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON bytes로 직렬화합니다 (stdlib 폴백)."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    loads = json.loads
@@ -12,6 +12,9 @@ from typing import List
 class ThoughtTagFilter:
     """<thought>...</thought> 태그 내용을 필터링하는 상태 기반 필터."""
 
+    OPEN_TAG = "<thought>"
+    CLOSE_TAG = "</thought>"
+
     def __init__(self) -> None:
         self._in_thought_tag: bool = False
 
@@ -33,25 +36,26 @@ class ThoughtTagFilter:
         Returns:
             thought 태그가 제거된 텍스트
         """
+        # 문자 단위 파이썬 루프 대신 C 구현인 str.find로 태그 경계를
+        # 찾아 구간 단위로 처리합니다.
         result: List[str] = []
         i = 0
-        while i < len(text):
+        n = len(text)
+        while i < n:
             if self._in_thought_tag:
-                end_tag = "</thought>"
-                if text[i:].startswith(end_tag):
-                    self._in_thought_tag = False
-                    i += len(end_tag)
-                    continue
-                i += 1
-                continue
-
-            start_tag = "<thought>"
-            if text[i:].startswith(start_tag):
+                end = text.find(self.CLOSE_TAG, i)
+                if end < 0:
+                    # 닫는 태그가 이 청크에 없음 - 나머지는 전부 thought 내부
+                    break
+                self._in_thought_tag = False
+                i = end + len(self.CLOSE_TAG)
+            else:
+                start = text.find(self.OPEN_TAG, i)
+                if start < 0:
+                    result.append(text[i:])
+                    break
+                result.append(text[i:start])
                 self._in_thought_tag = True
-                i += len(start_tag)
-                continue
-
-            result.append(text[i])
-            i += 1
+                i = start + len(self.OPEN_TAG)
 
         return "".join(result)
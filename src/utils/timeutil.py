@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+시간 포맷 유틸리티 모듈
+
+Ollama 응답의 created_at에 쓰는 ISO-8601 UTC 타임스탬프를 제공합니다.
+초 단위로 메모이즈하여 고빈도 경로에서 datetime 포맷팅을 반복하지 않습니다.
+"""
+
+import time
+from datetime import datetime
+
+# (정수 초, 포맷된 문자열) 캐시. GIL 하에서 같은 값으로만 덮어쓰므로
+# 별도 락 없이 안전합니다.
+_ts_cache = [0, ""]
+
+
+def iso_now() -> str:
+    """현재 시각의 ISO-8601 UTC 문자열을 초 단위 캐시로 반환합니다."""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[1] = datetime.utcfromtimestamp(now).isoformat() + "Z"
+        _ts_cache[0] = now
+    return _ts_cache[1]
@@ -19,7 +19,7 @@ class AnthropicRouteErrorHandlingTests(unittest.TestCase):
         self.client = app.test_client()
 
     def test_streaming_context_error_returns_anthropic_error_body(self) -> None:
-        with patch("src.routes.anthropic.ChatHandler") as mock_chat_handler:
+        with patch("src.routes._shared.ChatHandler") as mock_chat_handler:
             mock_chat_handler.return_value.handle_chat_request.return_value = ProxyRequestError(
                 model="ollama-cloud:kimi-k2.5",
                 message="context window exceeded",
@@ -43,7 +43,7 @@ class AnthropicRouteErrorHandlingTests(unittest.TestCase):
         self.assertEqual(body["error"]["message"], "context window exceeded")
 
     def test_non_streaming_context_error_returns_anthropic_error_body(self) -> None:
-        with patch("src.routes.anthropic.ChatHandler") as mock_chat_handler:
+        with patch("src.routes._shared.ChatHandler") as mock_chat_handler:
             mock_chat_handler.return_value.handle_chat_request.return_value = ProxyRequestError(
                 model="ollama-cloud:kimi-k2.5",
                 message="context window exceeded",
@@ -66,7 +66,7 @@ class AnthropicRouteErrorHandlingTests(unittest.TestCase):
         self.assertEqual(body["error"]["message"], "context window exceeded")
 
     def test_user_image_block_is_forwarded_to_chat_handler(self) -> None:
-        with patch("src.routes.anthropic.ChatHandler") as mock_chat_handler:
+        with patch("src.routes._shared.ChatHandler") as mock_chat_handler:
             mock_chat_handler.return_value.handle_chat_request.return_value = ProxyRequestError(
                 model="cli-proxy-api:gpt-5.4-high",
                 message="context window exceeded",
@@ -150,7 +150,7 @@ class AnthropicRouteErrorHandlingTests(unittest.TestCase):
         self.assertEqual(proxied_request["tools"][0]["function"]["name"], "Read")
 
     def test_route_does_not_inject_or_execute_web_search_locally(self) -> None:
-        with patch("src.routes.anthropic.ChatHandler") as mock_chat_handler:
+        with patch("src.routes._shared.ChatHandler") as mock_chat_handler:
             mock_chat_handler.return_value.handle_chat_request.return_value = ProxyRequestError(
                 model="cli-proxy-api:gpt-5.5",
                 message="stop after inspecting proxied request",
@@ -372,7 +372,7 @@ class AnthropicRouteErrorHandlingTests(unittest.TestCase):
         )
 
     def test_advisor_forced_non_stream_returns_advisor_tool_result(self) -> None:
-        with patch("src.routes.anthropic.ChatHandler") as mock_chat_handler:
+        with patch("src.routes._shared.ChatHandler") as mock_chat_handler:
             mock_chat_handler.return_value.handle_chat_request.return_value = {
                 "choices": [
                     {
@@ -423,7 +423,7 @@ class AnthropicRouteErrorHandlingTests(unittest.TestCase):
         self.assertFalse(proxied["stream"])
 
     def test_advisor_stream_has_advisor_tool_result_content_block(self) -> None:
-        with patch("src.routes.anthropic.ChatHandler") as mock_chat_handler:
+        with patch("src.routes._shared.ChatHandler") as mock_chat_handler:
             mock_chat_handler.return_value.handle_chat_request.return_value = {
                 "choices": [
                     {"message": {"role": "assistant", "content": "advisor streaming"}}
@@ -463,7 +463,7 @@ class AnthropicRouteErrorHandlingTests(unittest.TestCase):
         )
 
     def test_advisor_forced_request_skipped_when_no_tools(self) -> None:
-        with patch("src.routes.anthropic.ChatHandler") as mock_chat_handler:
+        with patch("src.routes._shared.ChatHandler") as mock_chat_handler:
             mock_chat_handler.return_value.handle_chat_request.return_value = (
                 ProxyRequestError(
                     model="ollama-cloud:kimi-k2.5",
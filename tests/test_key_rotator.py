@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""KeyRotator 서킷 브레이커 동작 테스트"""
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.auth.key_rotator import KeyHealth, KeyRotator
+
+
+class KeyRotatorCircuitBreakerTest(unittest.TestCase):
+    ENV_VAR = "TEST_CIRCUIT_KEYS"
+
+    def setUp(self):
+        os.environ[self.ENV_VAR] = "key-a,key-b,key-c"
+        self.rotator = KeyRotator("CircuitTest", self.ENV_VAR)
+
+    def tearDown(self):
+        os.environ.pop(self.ENV_VAR, None)
+
+    def _fail_key(self, key, times):
+        for _ in range(times):
+            self.rotator.mark_key_failure(key)
+
+    def test_key_skipped_after_consecutive_failures(self):
+        self._fail_key("key-b", KeyHealth.CIRCUIT_FAILURE_THRESHOLD)
+
+        seen = {self.rotator.get_next_key() for _ in range(6)}
+        self.assertNotIn("key-b", seen)
+        self.assertEqual(seen, {"key-a", "key-c"})
+
+    def test_success_closes_circuit(self):
+        self._fail_key("key-b", KeyHealth.CIRCUIT_FAILURE_THRESHOLD)
+        self.rotator.mark_key_success("key-b")
+
+        seen = {self.rotator.get_next_key() for _ in range(6)}
+        self.assertIn("key-b", seen)
+
+    def test_failures_below_threshold_do_not_open_circuit(self):
+        self._fail_key("key-b", KeyHealth.CIRCUIT_FAILURE_THRESHOLD - 1)
+
+        seen = {self.rotator.get_next_key() for _ in range(6)}
+        self.assertIn("key-b", seen)
+
+    def test_all_keys_open_falls_back_to_round_robin(self):
+        for key in ("key-a", "key-b", "key-c"):
+            self._fail_key(key, KeyHealth.CIRCUIT_FAILURE_THRESHOLD)
+
+        # 전부 서킷이 열려도 키 없이 실패하지 않고 순환을 계속해야 합니다.
+        self.assertIn(
+            self.rotator.get_next_key(), {"key-a", "key-b", "key-c"}
+        )
+
+    def test_circuit_reopens_after_open_window(self):
+        self._fail_key("key-b", KeyHealth.CIRCUIT_FAILURE_THRESHOLD)
+        health = self.rotator.key_health[1]
+        # 오픈 시간이 지난 것으로 조정 (half-open)
+        health.circuit_open_until = time.time() - 1
+
+        seen = {self.rotator.get_next_key() for _ in range(6)}
+        self.assertIn("key-b", seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
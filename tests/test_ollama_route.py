@@ -15,7 +15,7 @@ class OllamaRouteReasoningFallbackTests(unittest.TestCase):
     def test_non_streaming_dict_response_uses_reasoning_when_content_is_empty(
         self,
     ) -> None:
-        with patch("src.routes.ollama.ChatHandler") as mock_chat_handler:
+        with patch("src.routes._shared.ChatHandler") as mock_chat_handler:
             mock_chat_handler.return_value.handle_chat_request.return_value = {
                 "choices": [{"message": {"content": "", "reasoning": "ok"}}]
             }
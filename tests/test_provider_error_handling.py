@@ -46,7 +46,7 @@ class ProviderErrorHandlingTests(unittest.TestCase):
         response.headers = {}
 
         with patch(
-            "src.providers.base.requests.post", return_value=response
+            "src.providers.base.http_session.post", return_value=response
         ) as mock_post:
             result = client.post_request(
                 url="https://example.com/v1/chat/completions",
@@ -75,7 +75,7 @@ class ProviderErrorHandlingTests(unittest.TestCase):
         response.headers = {}
 
         with patch(
-            "src.providers.base.requests.post", return_value=response
+            "src.providers.base.http_session.post", return_value=response
         ) as mock_post:
             result = client.post_request(
                 url="https://example.com/v1/chat/completions",
@@ -103,7 +103,7 @@ class ProviderErrorHandlingTests(unittest.TestCase):
         response.headers = {}
 
         with patch(
-            "src.providers.base.requests.post", return_value=response
+            "src.providers.base.http_session.post", return_value=response
         ) as mock_post:
             result = client.post_request(
                 url="https://example.com/v1/chat/completions",
@@ -135,7 +135,7 @@ class ProviderErrorHandlingTests(unittest.TestCase):
         response.headers = {}
 
         with patch(
-            "src.providers.base.requests.post", return_value=response
+            "src.providers.base.http_session.post", return_value=response
         ) as mock_post:
             result = client.post_request(
                 url="https://example.com/v1/chat/completions",
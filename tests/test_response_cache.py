@@ -0,0 +1,71 @@
+import unittest
+
+from src.services.response_cache import ResponseCache
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_put_and_get_round_trip(self) -> None:
+        cache = ResponseCache(maxsize=4, ttl_seconds=60)
+        key = ResponseCache.make_key(
+            {
+                "model": "ollama-cloud:minimax-m2.7",
+                "messages": [{"role": "user", "content": "hello"}],
+            }
+        )
+
+        cache.put(key, {"choices": [{"message": {"content": "hi"}}]})
+
+        self.assertEqual(
+            cache.get(key), {"choices": [{"message": {"content": "hi"}}]}
+        )
+
+    def test_same_request_produces_same_key(self) -> None:
+        req = {
+            "model": "cohere:command-a-03-2025",
+            "messages": [{"role": "user", "content": "hello"}],
+            "stream": False,
+        }
+
+        self.assertEqual(ResponseCache.make_key(req), ResponseCache.make_key(dict(req)))
+
+    def test_different_model_produces_different_key(self) -> None:
+        base = {"messages": [{"role": "user", "content": "hello"}]}
+
+        key_a = ResponseCache.make_key({**base, "model": "a"})
+        key_b = ResponseCache.make_key({**base, "model": "b"})
+
+        self.assertNotEqual(key_a, key_b)
+
+    def test_different_reasoning_settings_produce_different_keys(self) -> None:
+        base = {
+            "model": "qwen3-coder-plus",
+            "messages": [{"role": "user", "content": "hello"}],
+        }
+
+        key_plain = ResponseCache.make_key(base)
+        key_thinking = ResponseCache.make_key({**base, "thinking_level": "high"})
+        key_reasoning = ResponseCache.make_key({**base, "reasoning_effort": "low"})
+
+        self.assertNotEqual(key_plain, key_thinking)
+        self.assertNotEqual(key_plain, key_reasoning)
+        self.assertNotEqual(key_thinking, key_reasoning)
+
+    def test_expired_entry_is_not_returned(self) -> None:
+        cache = ResponseCache(maxsize=4, ttl_seconds=0)
+        cache.put("key", {"choices": []})
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_lru_eviction_drops_oldest_entry(self) -> None:
+        cache = ResponseCache(maxsize=2, ttl_seconds=60)
+        cache.put("a", {"value": 1})
+        cache.put("b", {"value": 2})
+        cache.put("c", {"value": 3})
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), {"value": 2})
+        self.assertEqual(cache.get("c"), {"value": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
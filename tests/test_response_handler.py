@@ -11,9 +11,9 @@ class _DummyStreamingResponse:
         ]
         self.closed = False
 
-    def iter_lines(self):
+    def iter_content(self, chunk_size=None):
         for line in self._lines:
-            yield line
+            yield line + b"\n"
 
     def close(self):
         self.closed = True
@@ -59,7 +59,9 @@ class ResponseHandlerTests(unittest.TestCase):
                 response, "ollama-cloud:minimax-m2.7"
             )
         )
-        joined = "".join(chunks)
+        contents = [
+            json.loads(chunk)["message"]["content"] for chunk in chunks
+        ]
 
-        self.assertIn('"content": "ok"', joined)
+        self.assertIn("ok", contents)
         self.assertTrue(response.closed)